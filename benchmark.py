@@ -99,6 +99,60 @@ def print_comparison(ells):
     )
 
 
+def print_evaluate_many_comparison(ells, batch_sizes=(1, 2, 3, 8, 32)):
+    """
+    Compare the matrix evaluation of VéluSqrt `evaluate_many()`, which
+    includes computing its matrices for a new isogeny, with phi(P)
+    for each point. Used to tune the thresholds of `evaluate_many()`
+    """
+    data = []
+    for ell in ells:
+        if ell < 17:
+            continue
+        ell = ZZ(ell)
+        cofactor = (p + 1) // ell
+        ker = K(cofactor * P)
+        imgs = [K(k * Q) for k in range(1, max(batch_sizes) + 1)]
+
+        repeat = 5
+        for m in batch_sizes:
+            points = imgs[:m]
+
+            single = 10**100
+            matrix = 10**100
+            for _ in range(repeat):
+                phi = KummerLineIsogeny_VeluSqrt(K, ker, ell)
+                used = "matrix" if phi._use_matrix_evaluation(m) else "phi(P)"
+                t0 = time.process_time_ns()
+                expected = [phi(R) for R in points]
+                single = min(time.process_time_ns() - t0, single)
+
+                # A fresh isogeny, so the precomputation is included
+                phi = KummerLineIsogeny_VeluSqrt(K, ker, ell)
+                t0 = time.process_time_ns()
+                images = phi._evaluate_many_matrix(points)
+                matrix = min(time.process_time_ns() - t0, matrix)
+
+            assert images == expected
+            single = single // 1000
+            matrix = matrix // 1000
+            data.append([ell, m, single, matrix, f"{single / matrix:0.2f}", used])
+
+    print(
+        tabulate(
+            data,
+            headers=[
+                "ell",
+                "points",
+                "phi(P) (us)",
+                "matrix (us)",
+                "phi(P)/matrix",
+                "evaluate_many uses",
+            ],
+        )
+    )
+
+
 def profile_codomain(ell):
     p = K.base_ring().characteristic()
 
@@ -182,6 +236,7 @@ if __name__ == "__main__":
 
     ells = [ell for ell, _ in factor(p + 1)]
     print_comparison(ells)
+    print_evaluate_many_comparison(ells)
 
     # profile_image(839)
     # profile_image(41161)
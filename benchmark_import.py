@@ -0,0 +1,63 @@
+"""
+Benchmark the time to import the Kummer Line modules in a fresh
+Python process, compared to importing cypari2 and sage.all
+
+Usage: python benchmark_import.py [repeat]
+"""
+
+import subprocess
+import sys
+import time
+
+from tabulate import tabulate
+
+# Each statement is run in a new interpreter, and we also record
+# whether sage.all was imported as a side effect
+STATEMENTS = [
+    ("cypari2", "import cypari2"),
+    ("kummer_line", "import kummer_line"),
+    ("kummer_isogeny", "import kummer_isogeny"),
+    ("kummer_csidh", "import kummer_csidh"),
+    ("kummer_walk", "import kummer_walk"),
+    ("kummer_async", "import kummer_async"),
+    ("kummer_metrics", "import kummer_metrics"),
+    ("sage.all", "import sage.all"),
+]
+
+CHECK_SAGE = "import sys; print('sage.all' in sys.modules)"
+
+
+def time_import(statement, repeat):
+    """
+    Return the fastest wall time in ms to run `statement` in a new
+    interpreter, minus the cost of starting the interpreter, and
+    whether sage.all was loaded
+    """
+
+    def run(code):
+        t0 = time.perf_counter_ns()
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        return time.perf_counter_ns() - t0, out.stdout.strip()
+
+    baseline = min(run("pass")[0] for _ in range(repeat))
+    elapsed = min(run(statement)[0] for _ in range(repeat))
+    _, loaded = run(f"{statement}; {CHECK_SAGE}")
+    return (elapsed - baseline) // 10**6, loaded == "True"
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    data = []
+    for name, statement in STATEMENTS:
+        ms, sage_loaded = time_import(statement, repeat)
+        data.append([name, ms, sage_loaded])
+
+    print(
+        tabulate(
+            data,
+            headers=["module", "import time (ms)", "sage.all loaded"],
+        )
+    )
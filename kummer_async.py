@@ -0,0 +1,482 @@
+"""
+asyncio front-end for computing Kummer Line isogenies in a pool of
+worker processes
+
+===========================================================================
+
+USAGE:
+
+async with AsyncIsogenyExecutor(max_workers=4, max_pending=64) as executor:
+    phi = await executor.compute_isogeny(L, xK, degree, points=[xP, xQ])
+    imxP, imxQ = phi.images()
+    imxR, = await executor.evaluate(phi, [xR], timeout=1.0)
+
+Computing an isogeny chain takes 100-300 ms for the usual parameters, which
+would block the event loop. The executor runs the computation in a process
+pool, and the coroutines only wait for the result:
+
+- backpressure: at most `max_pending` requests are queued or running, and
+  further requests wait for a free slot. With `wait=False` a request
+  raises asyncio.QueueFull instead of waiting.
+- timeouts: every request accepts `timeout=...` (in seconds, defaulting to
+  the executor `timeout`) and raises asyncio.TimeoutError when it expires.
+  The timeout covers the wait for a free slot as well as the computation.
+- cancellation: when a request is cancelled or times out, the worker is
+  told to stop and abandons the chain before its next step, so the worker
+  is free for the next request.
+
+The module functions `compute_isogeny()` and `evaluate()` use a default
+executor, created on first use with `configure_executor(...)` defaults.
+
+===========================================================================
+
+INFO:
+
+Points and Kummer Lines are sent to the workers as their base field and
+SageMath field elements, and are reconstructed on the other side, so the
+pari elements are never pickled.
+
+`compute_isogeny()` returns an `AsyncKummerLineIsogeny`, which holds the
+codomain and images, together with the kernel which defines it. The steps
+of the chain stay in the worker, which stores them in its isogeny cache
+(see `enable_isogeny_cache()`) so that `evaluate()` only recomputes the
+chain when the request is handled by a different worker, or the entry has
+been evicted.
+
+Cancellation is signalled through an array in shared memory, created with
+the pool and inherited by the workers, with one entry per slot of
+`max_pending`. Each request takes a free slot and a new generation number,
+and cancelling it writes the generation to its entry, so neither side
+needs a round trip to another process. The worker reads the entry before
+each step of the chain and before every `CANCEL_CHECK_INTERVAL` images,
+and stops when it holds a generation at least its own. Generations only
+increase, so a worker which was cancelled still stops after its slot has
+been reused. A cancelled request releases its slot immediately, while the
+worker finishes its current step.
+"""
+
+# Python imports
+import asyncio
+import concurrent.futures
+import multiprocessing
+
+CANCEL_CHECK_INTERVAL = 16
+
+# Local imports
+from kummer_line import KummerLine, KummerPoint, Integer
+from kummer_isogeny import (
+    KummerLineIsogeny,
+    enable_isogeny_cache,
+    factored_kummer_isogeny,
+    isogeny_cache,
+)
+
+
+class IsogenyCancelledError(Exception):
+    """
+    Raised in a worker when the request it is computing was cancelled
+    """
+
+    pass
+
+
+# =================================================== #
+#   Serialisation of Kummer Lines and points          #
+# =================================================== #
+
+
+# Sage field elements are pickled by the executor in a background thread,
+# which is not safe with PARI, so everything sent to or from a worker is
+# first converted to Python ints in the thread that owns it.
+
+
+def _field_to_data(F):
+    if F.degree() == 1:
+        return int(F.characteristic()), None, None
+    modulus = [int(c) for c in F.modulus()]
+    return int(F.characteristic()), modulus, F.variable_name()
+
+
+def _field_from_data(data):
+    from sage.rings.finite_rings.finite_field_constructor import GF
+
+    p, modulus, name = data
+    if modulus is None:
+        return GF(p)
+    return GF(p ** (len(modulus) - 1), name=name, modulus=modulus)
+
+
+def _element_to_data(F, x):
+    x = F(x)
+    if F.degree() == 1:
+        return int(x)
+    return int(x.to_integer())
+
+
+def _line_to_data(L):
+    F = L.base_ring()
+    A, C = L.extract_constants()
+    return _field_to_data(F), _element_to_data(F, A), _element_to_data(F, C)
+
+
+def _line_from_data(data):
+    field_data, A, C = data
+    F = _field_from_data(field_data)
+    return KummerLine(F, [F.from_integer(A), F.from_integer(C)])
+
+
+def _point_to_data(P):
+    F = P.base_ring()
+    X, Z = P.XZ()
+    return _element_to_data(F, X), _element_to_data(F, Z)
+
+
+def _point_from_data(L, data):
+    F = L.base_ring()
+    X, Z = data
+    return L((F.from_integer(X), F.from_integer(Z)))
+
+
+# =================================================== #
+#   Functions run by the worker processes             #
+# =================================================== #
+
+
+_cancelled = None
+
+
+def _worker_initializer(cache_size, cancelled):
+    """
+    Each worker keeps the chains it computes in its own isogeny cache,
+    and the shared array of cancelled generations
+    """
+    global _cancelled
+    _cancelled = cancelled
+    if cache_size:
+        enable_isogeny_cache(maxsize=cache_size)
+
+
+def _check_cancelled(cancel):
+    """
+    Raise IsogenyCancelledError when the request with the given
+    (slot, generation) has been cancelled
+    """
+    slot, generation = cancel
+    if _cancelled[slot] >= generation:
+        raise IsogenyCancelledError
+
+
+def _worker_chain(L, K, degree, factorization, threshold, cancel):
+    """
+    Compute the steps of the chain with kernel K, checking for
+    cancellation before each step
+    """
+
+    def interrupt():
+        _check_cancelled(cancel)
+
+    cache = isogeny_cache()
+    key = None
+    if cache is not None:
+        key = cache.key(L, K, degree, threshold)
+        phis = cache.get(key)
+        if phis is not None:
+            return KummerLineIsogeny.from_factors(phis)
+
+    if not K.has_order(degree, factorization=factorization):
+        raise ValueError("Input point does not have correct order")
+
+    phis = factored_kummer_isogeny(
+        L,
+        K,
+        degree,
+        threshold=threshold,
+        factorization=factorization,
+        interrupt=interrupt,
+    )
+    if cache is not None:
+        cache.put(key, phis)
+    return KummerLineIsogeny.from_factors(phis)
+
+
+def _worker_evaluate(
+    line_data, kernel_data, degree, factorization, threshold, points_data, cancel
+):
+    """
+    Compute (or look up) the chain, and the images of the points,
+    returned as serialised data
+    """
+    L = _line_from_data(line_data)
+    K = _point_from_data(L, kernel_data)
+    phi = _worker_chain(L, K, degree, factorization, threshold, cancel)
+
+    images = []
+    for i, data in enumerate(points_data):
+        if i % CANCEL_CHECK_INTERVAL == 0:
+            _check_cancelled(cancel)
+        images.append(_point_to_data(phi(_point_from_data(L, data))))
+
+    return _line_to_data(phi.codomain()), images
+
+
+# =================================================== #
+#   Results and executor                              #
+# =================================================== #
+
+
+class AsyncKummerLineIsogeny:
+    """
+    The result of `AsyncIsogenyExecutor.compute_isogeny()`: the codomain
+    and the images of the points supplied, with the kernel so further
+    points can be evaluated with `AsyncIsogenyExecutor.evaluate()`
+    """
+
+    def __init__(
+        self, domain, kernel, degree, codomain, images, factorization, threshold
+    ):
+        self._domain = domain
+        self._kernel = kernel
+        self._degree = degree
+        self._codomain = codomain
+        self._images = images
+        self._factorization = factorization
+        self._threshold = threshold
+
+    def __repr__(self):
+        return f"Isogeny of degree {self._degree.factor()} from {self._domain} to {self._codomain}"
+
+    def domain(self):
+        """
+        Return the domain of the isogeny
+        """
+        return self._domain
+
+    def codomain(self):
+        """
+        Return the codomain of the isogeny
+        """
+        return self._codomain
+
+    def kernel(self):
+        """
+        Return the kernel point of the isogeny
+        """
+        return self._kernel
+
+    def degree(self):
+        """
+        Return the degree of the isogeny
+        """
+        return self._degree
+
+    def images(self):
+        """
+        Return the images of the points supplied when the isogeny
+        was computed
+        """
+        return self._images
+
+
+class AsyncIsogenyExecutor:
+    """
+    Computes Kummer Line isogenies in a process pool, with at most
+    `max_pending` requests queued or running at once, and a default
+    per-request timeout in seconds
+    """
+
+    def __init__(
+        self, max_workers=None, max_pending=64, timeout=None, cache_size=128
+    ):
+        max_pending = int(max_pending)
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive")
+
+        # The cancelled generation of each slot, shared with the workers
+        self._cancelled = multiprocessing.Array("q", max_pending, lock=False)
+        self._free_slots = list(range(max_pending))
+        self._generation = 0
+
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_worker_initializer,
+            initargs=(cache_size, self._cancelled),
+        )
+        self._max_pending = max_pending
+        self._slots = asyncio.Semaphore(max_pending)
+        self._timeout = timeout
+        self._closed = False
+
+    def __repr__(self):
+        return f"Asynchronous isogeny executor with at most {self._max_pending} pending requests"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """
+        Shut down the worker processes, cancelling queued requests
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.to_thread(self._pool.shutdown, wait=True, cancel_futures=True)
+
+    async def _submit(self, fn, args, timeout, wait):
+        """
+        Run fn(*args, cancel) in the pool once a slot is free, where
+        cancel = (slot, generation). The timeout covers both the wait for
+        a slot and the computation.
+        """
+        if self._closed:
+            raise RuntimeError("The executor has been closed")
+        if not wait and self._slots.locked():
+            raise asyncio.QueueFull("Too many pending isogeny requests")
+        if timeout is None:
+            timeout = self._timeout
+        return await asyncio.wait_for(self._run(fn, args), timeout)
+
+    async def _run(self, fn, args):
+        """
+        Wait for a slot and run fn(*args, cancel) in the pool, telling
+        the worker to stop when the request is cancelled or times out
+        """
+        async with self._slots:
+            slot = self._free_slots.pop()
+            self._generation += 1
+            generation = self._generation
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._pool, fn, *args, (slot, generation)
+                )
+            except asyncio.CancelledError:
+                self._cancelled[slot] = generation
+                raise
+            finally:
+                self._free_slots.append(slot)
+
+    async def compute_isogeny(
+        self,
+        domain,
+        kernel,
+        degree,
+        points=None,
+        factorization=None,
+        threshold=1500,
+        timeout=None,
+        wait=True,
+    ):
+        """
+        Compute the isogeny with the given kernel, and the images of
+        the points, in a worker process
+        """
+        if not isinstance(domain, KummerLine):
+            raise ValueError(f"not a kummer line: {domain}")
+        points = [] if points is None else list(points)
+        for P in [kernel] + points:
+            if not isinstance(P, KummerPoint) or P.parent() != domain:
+                raise ValueError(f"{P} is not a point on {domain}")
+
+        degree = Integer(degree)
+        if factorization is not None:
+            factorization = tuple((Integer(l), e) for l, e in factorization)
+
+        args = (
+            _line_to_data(domain),
+            _point_to_data(kernel),
+            degree,
+            factorization,
+            threshold,
+            [_point_to_data(P) for P in points],
+        )
+        line_data, images = await self._submit(_worker_evaluate, args, timeout, wait)
+
+        codomain = _line_from_data(line_data)
+        images = tuple(_point_from_data(codomain, data) for data in images)
+        return AsyncKummerLineIsogeny(
+            domain, kernel, degree, codomain, images, factorization, threshold
+        )
+
+    async def evaluate(self, phi, points, timeout=None, wait=True):
+        """
+        Evaluate the isogeny phi, computed by `compute_isogeny()`, on the
+        points in a worker process
+        """
+        if not isinstance(phi, AsyncKummerLineIsogeny):
+            raise TypeError(f"not an asynchronously computed isogeny: {phi}")
+        domain = phi.domain()
+        points = list(points)
+        for P in points:
+            if not isinstance(P, KummerPoint) or P.parent() != domain:
+                raise ValueError(f"{P} is not a point on {domain}")
+
+        args = (
+            _line_to_data(domain),
+            _point_to_data(phi.kernel()),
+            phi.degree(),
+            phi._factorization,
+            phi._threshold,
+            [_point_to_data(P) for P in points],
+        )
+        _, images = await self._submit(_worker_evaluate, args, timeout, wait)
+
+        codomain = phi.codomain()
+        return [_point_from_data(codomain, data) for data in images]
+
+
+# =================================================== #
+#   Default executor                                  #
+# =================================================== #
+
+_executor = None
+
+
+def configure_executor(**kwargs):
+    """
+    Create the default executor used by `compute_isogeny()` and
+    `evaluate()`, see `AsyncIsogenyExecutor` for the arguments. Must be
+    called before the default executor is first used.
+    """
+    global _executor
+    if _executor is not None:
+        raise RuntimeError("The default executor has already been created")
+    _executor = AsyncIsogenyExecutor(**kwargs)
+    return _executor
+
+
+def default_executor():
+    """
+    Return the default executor, creating it when needed
+    """
+    if _executor is None:
+        configure_executor()
+    return _executor
+
+
+async def shutdown_executor():
+    """
+    Close the default executor
+    """
+    global _executor
+    if _executor is not None:
+        await _executor.close()
+        _executor = None
+
+
+async def compute_isogeny(domain, kernel, degree, **kwargs):
+    """
+    Compute an isogeny with the default executor, see
+    `AsyncIsogenyExecutor.compute_isogeny()`
+    """
+    return await default_executor().compute_isogeny(domain, kernel, degree, **kwargs)
+
+
+async def evaluate(phi, points, **kwargs):
+    """
+    Evaluate an isogeny with the default executor, see
+    `AsyncIsogenyExecutor.evaluate()`
+    """
+    return await default_executor().evaluate(phi, points, **kwargs)
@@ -0,0 +1,214 @@
+"""
+CSIDH class group action on Kummer Lines over GF(p)
+
+===========================================================================
+
+USAGE:
+
+L_new = group_action(L, exponents, primes)
+
+Where L is the KummerLine of a supersingular Montgomery curve over GF(p)
+with p = 4 * prod(primes) - 1, (or more generally, every prime divides
+p + 1) and exponents is a vector of integers (e_1, ..., e_n) such that the
+ideal class l_1^e_1 * ... * l_n^e_n acts on L.
+
+Exponent vectors can be sampled with `random_exponents(n, bound)`.
+
+===========================================================================
+
+INFO:
+
+Following Algorithm 2 of CSIDH (https://ia.cr/2018/383) by Castryck, Lange,
+Martindale, Panny and Renes, with points sampled using Elligator 2 as in
+https://ia.cr/2019/1121 by Cervantes-Vázquez, Chenu, Chi-Domínguez, De Feo,
+Rodríguez-Henríquez and Smith.
+
+Each round, Elligator 2 gives one point P on the curve and one point T on
+the twist. Points on the curve are used for the primes with positive
+exponent and points on the twist for the primes with negative exponent.
+
+- With the "batched" strategy, all the primes of the same sign are handled
+  by one point: we clear the cofactor once, then for each prime we compute
+  the kernel by a scalar multiplication and push the point through the
+  isogeny, so the point is reused across primes. The twist point is pushed
+  through the isogenies computed from the curve point.
+- With the "simple" strategy, we compute a single isogeny per sampled point,
+  which is slower but is useful as a baseline for benchmarks.
+
+When radical=True, the primes 3, 5 and 7 with |e_i| > 1 are handled first by
+a single radical isogeny chain each (see kummer_radical.py): one point of
+order ell gives the first kernel and every other step costs one ell-th
+root. As ell does not divide p - 1, the chain is the unique rational
+non-backtracking path, so it computes exactly l^e_i. For negative
+exponents, the chain is computed on the twist E_{-A} and we map back with
+A -> -A.
+"""
+
+# Python imports
+import math
+import random
+
+# Local imports
+from kummer_line import KummerLine, Integer
+from kummer_isogeny import KummerLineIsogeny_Velu, KummerLineIsogeny_VeluSqrt
+from kummer_radical import RADICAL_DEGREES, radical_isogeny_chain
+
+
+def random_exponents(n, bound):
+    """
+    Sample a random exponent vector of length n with entries
+    in the range [-bound, bound]
+    """
+    return [random.randint(-bound, bound) for _ in range(n)]
+
+
+def _sample_points(L):
+    """
+    Sample a random point on the curve and a random point on the twist
+    using Elligator 2. For A = 0 Elligator is not defined so we return
+    a single random point, with None for the other
+    """
+    F = L.base_ring()
+    p = F.characteristic()
+    A, _ = L.extract_constants()
+    while True:
+        if A:
+            try:
+                return L.elligator(random.randrange(2, p - 1))
+            except ValueError:
+                continue
+
+        xP = L(F(random.randrange(1, p)))
+        if L.is_on_curve(xP):
+            return xP, None
+        return None, xP
+
+
+def _isogeny_algorithm(ell, threshold):
+    if ell > threshold:
+        return KummerLineIsogeny_VeluSqrt
+    return KummerLineIsogeny_Velu
+
+
+def _radical_action(L, ell, e, N):
+    """
+    Compute the action of l^e for ell in RADICAL_DEGREES with a single
+    radical isogeny chain of length |e|
+    """
+    F = L.base_ring()
+    A, C = L.extract_constants()
+
+    # l^-e on E_A is l^e on the twist E_{-A}
+    if e < 0:
+        L = KummerLine(F, [-A, C])
+
+    while True:
+        xP, _ = _sample_points(L)
+        if xP is None:
+            continue
+        xK = (N // ell) * xP
+        if not xK.is_zero():
+            break
+
+    L = radical_isogeny_chain(L, xK, ell, abs(e))
+    if e < 0:
+        A, C = L.extract_constants()
+        L = KummerLine(F, [-A, C])
+    return L
+
+
+def group_action(
+    L, exponents, primes, strategy="batched", threshold=1000, radical=False
+):
+    """
+    Compute the action of the ideal class l_1^e_1 * ... * l_n^e_n on
+    the Kummer Line L, returning the resulting Kummer Line
+    """
+    if not isinstance(L, KummerLine):
+        raise ValueError(f"not a kummer line: {L}")
+    if strategy not in ("batched", "simple"):
+        raise ValueError(f"unknown strategy: {strategy}")
+
+    primes = [Integer(ell) for ell in primes]
+    exponents = list(exponents)
+    if len(exponents) != len(primes):
+        raise ValueError("There must be one exponent for each prime")
+
+    F = L.base_ring()
+    if F.degree() != 1:
+        raise ValueError("The group action is only defined over GF(p)")
+
+    # Both the curve and twist have order p + 1
+    N = F.characteristic() + 1
+    if N % math.prod(primes):
+        raise ValueError("Every prime must divide p + 1")
+
+    if radical:
+        for i, (ell, e) in enumerate(zip(primes, exponents)):
+            if ell in RADICAL_DEGREES and abs(e) > 1:
+                L = _radical_action(L, ell, e, N)
+                exponents[i] = 0
+
+    while any(exponents):
+        xP, xT = _sample_points(L)
+
+        # Primes handled by the curve point and the twist point
+        if strategy == "batched":
+            S_curve = [i for i, e in enumerate(exponents) if e > 0]
+            S_twist = [i for i, e in enumerate(exponents) if e < 0]
+        else:
+            S_curve = [i for i, e in enumerate(exponents) if e > 0][:1]
+            S_twist = [i for i, e in enumerate(exponents) if e < 0][:1]
+
+        k_curve = math.prod(primes[i] for i in S_curve)
+        k_twist = math.prod(primes[i] for i in S_twist)
+        Q_curve = None if xP is None or not S_curve else (N // k_curve) * xP
+        Q_twist = None if xT is None or not S_twist else (N // k_twist) * xT
+
+        # Compute the isogenies from the curve point, pushing the twist
+        # point through each isogeny
+        if Q_curve is not None:
+            L, Q_twist = _batched_isogenies(
+                L, Q_curve, k_curve, S_curve, primes, exponents, 1, Q_twist, threshold
+            )
+
+        # Compute the isogenies from the twist point
+        if Q_twist is not None:
+            L, _ = _batched_isogenies(
+                L, Q_twist, k_twist, S_twist, primes, exponents, -1, None, threshold
+            )
+
+    return L
+
+
+def _batched_isogenies(L, Q, k, S, primes, exponents, sign, other, threshold):
+    """
+    Given Q of order dividing k = prod(primes[i] for i in S), compute an
+    isogeny of degree primes[i] for each i in S such that the kernel is
+    non-trivial, updating the exponents in place
+
+    The point `other` is pushed through all isogenies, and we return the
+    final codomain and the image of `other`
+    """
+    # Handle the largest primes first, as the cofactor multiplications
+    # are cheapest when k is smallest
+    S = sorted(S, key=lambda i: primes[i], reverse=True)
+    for n, i in enumerate(S):
+        ell = primes[i]
+        k //= ell
+        R = k * Q
+        if R.is_zero():
+            continue
+
+        KummerLineIsogenyAlgorithm = _isogeny_algorithm(ell, threshold)
+        phi = KummerLineIsogenyAlgorithm(L, R, ell, check=False)
+        L = phi.codomain()
+        exponents[i] -= sign
+
+        # Only push the points which will be used again
+        if n < len(S) - 1:
+            Q = phi(Q)
+        if other is not None:
+            other = phi(other)
+
+    return L, other
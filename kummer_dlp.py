@@ -0,0 +1,199 @@
+"""
+Discrete logarithms of Kummer points with respect to a torsion basis of
+smooth order, using pairings and Pohlig-Hellman
+
+===========================================================================
+
+USAGE:
+
+D = KummerDiscreteLog(xP, xQ, xPQ, N)
+a, b = D.decompose(xR, xRP, xRQ)
+
+Where (xP, xQ, xPQ) is a basis of E[N] with xPQ = x(P - Q), N is smooth
+and xR is a point of E[N] with xRP = x(R - P) and xRQ = x(R - Q). The
+output satisfies R = [a]P + [b]Q. As Kummer points are only defined up to
+sign, -R gives (-a, -b), and the differences must be computed from the
+same R.
+
+The precomputation in `KummerDiscreteLog` only depends on the basis, so
+one instance should be reused for every point decomposed in this basis.
+The factorisation of N can be supplied with `factorization=...`.
+
+===========================================================================
+
+INFO:
+
+Writing g = w_N(P, Q) for the Weil pairing, which has order exactly N for
+a basis, we have
+
+    w_N(R, Q) = g^a,    w_N(P, R) = g^b
+
+so the two-dimensional discrete logarithm in E[N] becomes two discrete
+logarithms in the subgroup of order N of GF(p^2)^*.
+
+These are solved with Pohlig-Hellman:
+
+- h is projected to the subgroups of order l^e for each l^e || N, with a
+  balanced tree of exponentiations: the factors are split in two halves
+  and h is raised to the product of each half before recursing, in the
+  same way as `KummerPoint.has_order()`
+- in the subgroup of order l^e, the logarithm x = x0 + l^e1 * x1 is found
+  by recursively solving for x0 modulo l^e1 and then x1 modulo l^(e - e1)
+  with e1 = e/2, so O(e log e) exponentiations are needed rather than e^2
+- in the subgroup of order l, logarithms are found by baby-step giant-step
+  with a table of sqrt(l) baby steps which is computed once per basis
+"""
+
+# Python imports
+import math
+
+# Local imports
+from kummer_line import Integer
+from kummer_pairing import weil_pairing
+
+
+class KummerDiscreteLog:
+    """
+    Pohlig-Hellman discrete logarithms with respect to a basis
+    (xP, xQ, xPQ) of the N-torsion, for smooth N
+    """
+
+    def __init__(self, xP, xQ, xPQ, N, factorization=None):
+        N = Integer(N)
+        if factorization is None:
+            factorization = N.factor()
+        factors = sorted((Integer(l), e) for l, e in factorization)
+        if math.prod(l**e for l, e in factors) != N:
+            raise ValueError(f"The factorization does not match {N = }")
+
+        self._basis = (xP, xQ, xPQ)
+        self._N = N
+        self._factors = factors
+
+        # The Weil pairing of the basis, which is a generator of the
+        # N-th roots of unity when the basis has full order
+        self._g = weil_pairing(xP, xQ, xPQ, N)
+
+        # Generators g_l of the subgroups of order l^e, and the
+        # baby-step giant-step tables for the subgroups of order l
+        self._generators = self._project(self._g, factors)
+        self._tables = []
+        for (l, e), g_l in zip(factors, self._generators):
+            root = g_l ** (l ** (e - 1))
+            if root == 1:
+                raise ValueError("The points do not form a basis of the N-torsion")
+            self._tables.append(self._bsgs_table(root, l))
+
+    def __repr__(self):
+        return f"Discrete logarithms for a basis of the {self._N}-torsion"
+
+    # =================================== #
+    #     Pohlig-Hellman in GF(p^k)^*     #
+    # =================================== #
+
+    @staticmethod
+    def _project(h, factors):
+        """
+        Compute h^(N / l^e) for each (l, e) in factors, with N the
+        product of all l^e, using a balanced tree of exponentiations
+        """
+        if len(factors) == 1:
+            return [h]
+
+        mid = len(factors) // 2
+        left, right = factors[:mid], factors[mid:]
+        m_left = math.prod(l**e for l, e in left)
+        m_right = math.prod(l**e for l, e in right)
+        return KummerDiscreteLog._project(
+            h**m_right, left
+        ) + KummerDiscreteLog._project(h**m_left, right)
+
+    @staticmethod
+    def _bsgs_table(root, l):
+        """
+        Precompute the baby steps root^j for 0 <= j < m = ceil(sqrt(l))
+        and the giant step root^-m
+        """
+        m = math.isqrt(l - 1) + 1
+        baby_steps = {}
+        R = root**0
+        for j in range(m):
+            baby_steps[R] = j
+            R *= root
+        return m, baby_steps, 1 / R
+
+    @staticmethod
+    def _log_prime(h, l, table):
+        """
+        Compute x modulo l such that root^x = h, where root is the
+        element of order l used to compute the table
+        """
+        m, baby_steps, giant_step = table
+        for i in range(m):
+            j = baby_steps.get(h)
+            if j is not None:
+                return (i * m + j) % l
+            h *= giant_step
+        raise ValueError("The element is not in the subgroup generated by the basis")
+
+    def _log_prime_power(self, h, g, l, e, table):
+        """
+        Compute x modulo l^e such that g^x = h, where g has order l^e,
+        by splitting x = x0 + l^e1 * x1 with e1 = e/2
+        """
+        if e == 1:
+            return self._log_prime(h, l, table)
+
+        e1 = e // 2
+        e2 = e - e1
+
+        # h^(l^e2) = (g^(l^e2))^x0 in the subgroup of order l^e1
+        x0 = self._log_prime_power(h ** (l**e2), g ** (l**e2), l, e1, table)
+
+        # h * g^-x0 = (g^(l^e1))^x1 in the subgroup of order l^e2
+        h = h / g**x0
+        x1 = self._log_prime_power(h, g ** (l**e1), l, e2, table)
+
+        return x0 + l**e1 * x1
+
+    def log(self, h):
+        """
+        Compute x modulo N such that g^x = h, where g = w_N(P, Q)
+        """
+        hs = self._project(h, self._factors)
+
+        residues, moduli = [], []
+        for (l, e), h_l, g_l, table in zip(
+            self._factors, hs, self._generators, self._tables
+        ):
+            residues.append(self._log_prime_power(h_l, g_l, l, e, table))
+            moduli.append(l**e)
+
+        from sage.arith.misc import CRT_list
+
+        return Integer(CRT_list(residues, moduli)) % self._N
+
+    # =================================== #
+    #     Decomposition of Kummer points  #
+    # =================================== #
+
+    def generator(self):
+        """
+        Return the Weil pairing g = w_N(P, Q) of the basis
+        """
+        return self._g
+
+    def decompose(self, xR, xRP, xRQ):
+        """
+        Compute (a, b) such that R = [a]P + [b]Q, from x(R), x(R - P)
+        and x(R - Q)
+
+        Any R in E[N] is supported, including the identity, P, Q and
+        points where R, R - P or R - Q is (0, 0), see `weil_pairing()`
+        """
+        xP, xQ, _ = self._basis
+
+        # w(R, Q) = g^a and w(P, R) = g^b
+        a = self.log(weil_pairing(xR, xQ, xRQ, self._N))
+        b = self.log(weil_pairing(xP, xR, xRP, self._N))
+        return a, b
@@ -13,10 +13,75 @@ can be lifted from the KummerLine `phi.dodomain().curve()`.
 
 Evaluation of the isogeny is done via `phi(xQ)` for some KummerPoint `xQ`.
 
+When the points to evaluate are known in advance, they can be pushed
+through the chain while it is computed:
+
+phi = KummerLineIsogeny(domain, kernel, degree, points=[xP, xQ])
+imxP, imxQ = phi.images()
+
+In this one-shot mode the individual steps are discarded as soon as they
+have been used, so `phi(xR)` cannot be called on new points.
+
+Isogenies are composed with `phi * psi`, which first evaluates psi and then
+phi. The result is a KummerLineIsogeny whose steps are flattened into an
+evaluation plan: a tuple of (f, data) pairs, one per step, evaluated in a
+single loop on the raw (X : Z) coordinates. Only the final image is
+constructed as a KummerPoint.
+
+Large sets of points, as KummerPoints or raw pairs (X, Z), are evaluated
+lazily with
+
+for imxP in phi.evaluate_stream(points, chunk_size=1024):
+    ...
+
+which reads the iterable in chunks and pushes each chunk through all the
+steps, so memory is bounded by the chunk size.
+
+The dual isogeny, from `phi.codomain()` back to `phi.domain()`, is computed
+with `phi.dual()`. The dual of a 2-isogeny always has kernel (0,0), which
+is computed with Vélu's formula followed by a scaling to a Montgomery curve.
+
+To evaluate full points of the Montgomery curves, rather than Kummer points,
+the isogeny can be wrapped as
+
+psi = KummerLineIsogenyHom(phi)
+imP = psi(P)
+
+which behaves like a SageMath EllipticCurveHom between `phi.domain().curve()`
+and `phi.codomain().curve()`.
+
+When the kernel of an odd degree isogeny defined over GF(q) only has points
+over an extension GF(q^k), the kernel can be given on the Kummer Line of the
+same curve over the extension:
+
+phi = KummerLineIsogeny_VeluExtension(domain, xK_ext, degree)
+
+The multiples of the kernel are grouped into Frobenius orbits, and the
+codomain and images are computed with arithmetic over GF(q) only. These
+steps can be collected into a chain with `KummerLineIsogeny.from_factors`.
+
+Computed chains can be stored in a bounded LRU cache, so that repeated
+calls to KummerLineIsogeny with the same (domain, kernel, degree) and
+threshold skip the chain computation:
+
+enable_isogeny_cache(maxsize=128, max_steps=None)
+phi = KummerLineIsogeny(domain, kernel, degree)  # computed
+phi = KummerLineIsogeny(domain, kernel, degree)  # cache hit
+isogeny_cache().cache_info()
+
+Entries are keyed by the canonical encodings of the domain and kernel, so
+any projective representation of the same curve and point gives a hit.
+The VéluSqrt threshold is part of the key, as it selects the algorithm of
+each step. In one-shot mode a hit only pushes the points through the
+cached steps, and the isogeny is still one-shot.
+The cache can be bounded by the number of chains and by the total number
+of steps stored across all chains, as a proxy for memory.
+
 NOTE:
 
 Where the degree can be composite, but for efficiency needs to be smooth.
-For a 2-isogeny, the point P = (0,0) cannot be used as a kernel 
+For a 2-isogeny with kernel P = (0,0), the codomain needs a square root of
+A^2 - 4C^2, so the 2-torsion must be defined over the base field.
 
 ========================================================================
 
@@ -53,16 +118,23 @@ Future Work:
 - Optimise VéluSqrt, it seems to be underperforming with a threshold of about 1000
   rather than 100 
 - Include isomorphisms of Kummer Lines
-- allow composition by defining __mul__ on isogenies to create a composite isogeny
 """
 
 
-# Sage imports
-from sage.all import prod, ZZ, PolynomialRing
-from sage.rings.generic import ProductTree
+# Python imports
+from collections import OrderedDict, namedtuple
+import itertools
+import math
+import threading
+import time
 
 # Local imports
-from kummer_line import KummerLine, KummerPoint, pari
+from kummer_line import KummerLine, KummerPoint, Integer, batch_inversion, pari
+from kummer_metrics import metrics, timed
+
+# SageMath is imported lazily, only VéluSqrt needs Sage polynomial rings
+# and product trees, so Vélu isogenies can be computed without importing
+# sage.all
 
 # =================================================== #
 # Generic class for creating an isogeny between       #
@@ -87,9 +159,10 @@ class KummerLineIsogeny_Generic:
         return f"Isogeny of degree {(self._degree).factor()} from {self._domain} to {self._codomain}"
 
     @staticmethod
-    def validate_input(domain, kernel, degree, check=True):
+    def validate_input(domain, kernel, degree, check=True, factorization=None):
         """
-        Helper function to check the input to the isogeny class is well-formed
+        Helper function to check the input to the isogeny class is well-formed,
+        the factorisation of the degree can be supplied to avoid computing it
         """
         if not isinstance(domain, KummerLine):
             raise ValueError(f"not a kummer line: {domain}")
@@ -101,10 +174,8 @@ class KummerLineIsogeny_Generic:
             raise ValueError(f"Kernel {kernel} is not a point on {domain}")
 
         if check:
-            # TODO actually check order with has_order_D function
-            assert (
-                degree * kernel
-            ).is_zero(), "Input point does not have correct order"
+            if not kernel.has_order(degree, factorization=factorization):
+                raise ValueError("Input point does not have correct order")
 
     def domain(self):
         """
@@ -112,12 +183,184 @@ class KummerLineIsogeny_Generic:
         """
         return self._domain
 
+    def evaluate_curve_point(self, P):
+        """
+        Evaluate the isogeny on a point P of the Montgomery curve
+        `self.domain().curve()`, returning the full image point on
+        `self.codomain().curve()`
+        """
+        E = self._codomain.curve()
+        if P.is_zero():
+            return E(0)
+
+        x, y = P.xy()
+        image = self._evaluate_xy(pari(x), pari(y))
+        if image is None:
+            return E(0)
+
+        F = self._codomain.base_ring()
+        x_new, y_new = image
+        return E(F(x_new), F(y_new))
+
     def codomain(self):
         """
         Return the codomain of the isogeny
         """
         return self._codomain
 
+    def __mul__(self, other):
+        """
+        Compose two isogenies, phi * psi is the isogeny which first
+        evaluates psi and then phi, returned as a KummerLineIsogeny
+        with a flattened evaluation plan
+        """
+        if not isinstance(other, KummerLineIsogeny_Generic):
+            return NotImplemented
+        if other.codomain() != self.domain():
+            raise ValueError(
+                "the codomain of the right factor must be the domain of the left factor"
+            )
+        return KummerLineIsogeny.from_factors(other._factors() + self._factors())
+
+    def _factors(self):
+        """
+        Return the prime degree steps of the isogeny as a tuple
+        """
+        return (self,)
+
+    def _evaluation_step(self):
+        """
+        Return a pair (f, data) such that f(X, Z, data) computes the
+        coordinates of the image of (X : Z) without constructing any
+        KummerPoint. Used to build the evaluation plan of a chain.
+        """
+        return _evaluate_xz_generic, self
+
+    def evaluate_many(self, points):
+        """
+        Evaluate the isogeny on a list of points, classes which can share
+        work between the points override this
+        """
+        return [self(P) for P in points]
+
+    def _evaluation_plan(self):
+        """
+        Return the evaluation steps (f, data) of all steps of the isogeny
+        """
+        return tuple(phi._evaluation_step() for phi in self._factors())
+
+    def evaluate_stream(self, points, chunk_size=1024):
+        """
+        Lazily evaluate the isogeny on an iterable of points, which can
+        be KummerPoints or raw pairs (X, Z) of coordinates. Points are
+        read in chunks of `chunk_size`, each chunk is pushed through all
+        steps of the plan together and the images are yielded in order,
+        as KummerPoints or as raw pairs (X, Z) following the input.
+
+        Only one chunk of inputs and images is held in memory at a time.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        plan = self._evaluation_plan()
+        steps = self._factors()
+        points = iter(points)
+        while chunk := list(itertools.islice(points, chunk_size)):
+            raw = []
+            coords = []
+            for P in chunk:
+                if isinstance(P, KummerPoint):
+                    if P.parent() != self._domain:
+                        raise ValueError(f"{P} is not a point on {self._domain}")
+                    raw.append(False)
+                    coords.append(P.XZ())
+                else:
+                    X, Z = P
+                    raw.append(True)
+                    coords.append((pari(X), pari(Z)))
+
+            # Push the whole chunk through each step in turn
+            registry = metrics()
+            for (f, data), phi in zip(plan, steps):
+                coords = _evaluate_plan_step(f, data, phi, coords, registry)
+
+            for is_raw, XZ in zip(raw, coords):
+                yield XZ if is_raw else self._codomain(XZ)
+
+    def _dual_kernel(self, T=None):
+        """
+        Compute a generator phi(T) of the kernel of the dual isogeny,
+        where T is a point of order ell on the domain which is not in
+        the kernel. When T is None, or is in the kernel, a point T is
+        found by clearing the cofactor of points on the curve or the
+        twist.
+
+        Sampling T assumes the domain is supersingular with the group
+        orders of the curves over GF(p) and GF(p^2) with trace zero:
+        p + 1 over GF(p), and (p + 1)^2 and (p - 1)^2 for the curve and
+        twist over GF(p^2). A ValueError is raised when a sampled point
+        shows this does not hold, and T must then be supplied.
+        """
+        ell = self._degree
+        if ell == 2:
+            # The 2-torsion points outside the kernel are the roots of
+            # the numerator of the x-map, so the dual has kernel (0,0)
+            return self._codomain((0, 1))
+
+        if T is not None:
+            K = self(T)
+            if not K.is_zero():
+                return K
+
+        # The curve and twist have orders (p + 1)^2 and (p - 1)^2 over
+        # GF(p^2), and p + 1 over GF(p) where the ell-torsion is split
+        # between the curve and the twist
+        L = self._domain
+        F = L.base_ring()
+        p = F.characteristic()
+        if F.degree() == 1:
+            orders = ((p + 1, False), (p + 1, True))
+        else:
+            orders = ((p + 1, False), (p - 1, True))
+
+        for N, twist in orders:
+            if N % ell:
+                continue
+            # When the kernel is the only subgroup of order ell on the
+            # curve (or twist), no point will be found, so we bound the
+            # number of attempts
+            for _, T in zip(range(32), L.sample_points(twist=twist)):
+                T = (N // ell) * T
+                if T.is_zero():
+                    continue
+                if not (ell * T).is_zero():
+                    raise ValueError(
+                        f"the {'twist' if twist else 'curve'} does not have order "
+                        f"{N if F.degree() == 1 else N**2}, supply a point T of "
+                        f"order {ell} to compute the dual"
+                    )
+                K = self(T)
+                if not K.is_zero():
+                    return K
+
+        raise ValueError(f"Could not find a point of order {ell} outside the kernel")
+
+    def _dual_from_kernel(self, K):
+        """
+        Compute the dual isogeny from a generator K of its kernel
+        """
+        return type(self)(self._codomain, K, self._degree, check=False)
+
+    def dual(self, T=None):
+        """
+        Compute the dual isogeny, with kernel generated by the image of
+        a point T of order ell on the domain which is not in the kernel.
+        When T is not supplied, such a point is found by sampling points.
+
+        The codomain of the dual is the domain of the isogeny.
+        """
+        return self._dual_from_kernel(self._dual_kernel(T))
+
     def degree(self):
         """
         Return the degree of the isogeny
@@ -125,6 +368,152 @@ class KummerLineIsogeny_Generic:
         return self._degree
 
 
+# =================================================== #
+# Evaluation of isogenies on raw (X : Z) coordinates, #
+# used by the evaluation plans of chains              #
+# =================================================== #
+
+
+def _evaluate_xz_generic(X, Z, phi):
+    """
+    Evaluate phi on (X : Z) by constructing the KummerPoint, used
+    for steps without a raw formula
+    """
+    return phi(phi.domain()((X, Z))).XZ()
+
+
+def _evaluate_plan_step(f, data, phi, coords, registry):
+    """
+    Evaluate the step (f, data) of a plan, for the prime degree isogeny
+    phi, on a list of coordinates (X, Z). When metrics are enabled, each
+    evaluation is recorded as for phi(P), except for steps which call
+    phi(P) and so are already recorded
+    """
+    if registry is None or f is _evaluate_xz_generic:
+        return [f(X, Z, data) for X, Z in coords]
+
+    images = []
+    for X, Z in coords:
+        start = time.perf_counter()
+        images.append(f(X, Z, data))
+        elapsed = time.perf_counter() - start
+        registry.observe(
+            "isogeny_evaluation_seconds",
+            elapsed,
+            algorithm=phi._algorithm,
+            ell=phi._degree,
+        )
+    return images
+
+
+def _evaluate_xz_odd(XP, ZP, edwards_multiples):
+    """
+    Costello-Hisil (https://ia.cr/2017/504) formula for evaluating an
+    odd degree isogeny on (XP : ZP), given the precomputed multiples
+    (Xi - Zi, Xi + Zi) of the kernel
+    """
+    Psum = XP + ZP
+    Pdiff = XP - ZP
+
+    # Loop through the d-multiples, these are
+    # precomputed from the codomain computation
+    X_new, Z_new = 1, 1
+    for EY, EZ in edwards_multiples:
+        diff_EZ = Pdiff * EZ
+        sum_EY = EY * Psum
+        X_new *= diff_EZ + sum_EY
+        Z_new *= diff_EZ - sum_EY
+
+    # Square and multiple with original
+    X_new = X_new**2 * XP
+    Z_new = Z_new**2 * ZP
+
+    return X_new, Z_new
+
+
+def _evaluate_xz_even(XP, ZP, kernel_data):
+    """
+    Renes (https://ia.cr/2017/1198) formula for evaluating an even
+    degree isogeny on (XP : ZP), given (XK + ZK, XK - ZK) for the
+    kernel (XK : ZK)
+    """
+    T0, T1 = kernel_data
+    T2 = XP + ZP
+    T3 = ZP - XP  # Typo in formula: paper says XP - ZP
+    T4 = T3 * T0  # (ZP - XP)(XK + ZK)
+    T5 = T2 * T1  # (XP + ZP)(XK - ZK)
+    T6 = T4 - T5  # (ZP - XP)(XK + ZK) - (XP + ZP)(XK - ZK)
+    T7 = T4 + T5  # (ZP - XP)(XK + ZK) + (XP + ZP)(XK - ZK)
+    T8 = XP * T6  # XP * ((ZP - XP)(XK + ZK) - (XP + ZP)(XK - ZK))
+    T9 = ZP * T7  # ZP * ((ZP - XP)(XK + ZK) + (XP + ZP)(XK - ZK))
+
+    return T8, T9
+
+
+def _evaluate_xz_even_origin(XP, ZP, kernel_data):
+    """
+    Evaluate a 2-isogeny with kernel (0 : 1) on (XP : ZP), given the
+    constants (b, a, d) of the x-map
+
+        (a(XP - ZP)^2 + b*XP*ZP : d*XP*ZP)
+
+    From (A : C), Vélu's formula scaled to a Montgomery curve has
+    (b, a, d) = (A + 2C, C, r) with r^2 = A^2 - 4C^2. The duals of
+    2-isogenies use the same form, see `_dual_from_kernel()`.
+    """
+    b, a, d = kernel_data
+    XZ = XP * ZP
+    D = XP - ZP
+    return a * D * D + b * XZ, d * XZ
+
+
+def _evaluate_xz_sqrt(X, Z, phi):
+    """
+    Evaluate the VéluSqrt isogeny phi on (X : Z)
+    """
+    if not Z:
+        return X, Z
+    return phi._evaluate_xz(X, Z)
+
+
+def _evaluate_xz_orbits(XP, ZP, orbit_polynomials):
+    """
+    Evaluate an odd degree isogeny on (XP : ZP) from the products of
+    the Costello-Hisil factors over each Frobenius orbit of the kernel
+    multiples. Each orbit is given by the coefficients ck of the form
+    sum ck U^(m-k) V^k with U = XP - ZP and V = XP + ZP, and the
+    Z-coordinate uses the same form evaluated at (U, -V).
+    """
+    U = XP - ZP
+    V = XP + ZP
+
+    # Powers of U and V up to the size of the largest orbit
+    m = max(len(coeffs) for coeffs in orbit_polynomials) - 1
+    U_pows, V_pows = [1], [1]
+    for _ in range(m):
+        U_pows.append(U_pows[-1] * U)
+        V_pows.append(V_pows[-1] * V)
+
+    X_new, Z_new = 1, 1
+    for coeffs in orbit_polynomials:
+        n = len(coeffs) - 1
+        even, odd = 0, 0
+        for k, c in enumerate(coeffs):
+            t = c * U_pows[n - k] * V_pows[k]
+            if k % 2:
+                odd += t
+            else:
+                even += t
+        X_new *= even + odd
+        Z_new *= even - odd
+
+    # Square and multiple with original
+    X_new = X_new**2 * XP
+    Z_new = Z_new**2 * ZP
+
+    return X_new, Z_new
+
+
 # =================================================== #
 # Computation of isogenies between Kummer lines using #
 # x-only formula by Costello-Hisil-Renes              #
@@ -136,13 +525,15 @@ class KummerLineIsogeny_Velu(KummerLineIsogeny_Generic):
     Computes prime degree isogenies with Vélu-like formula.
 
     - When ell is odd, we use Costello-Hisil (https://ia.cr/2017/504)
-    - When ell is even, we can use Renes (https://ia.cr/2017/1198) providing
-    that the kernel is not (0,0)
-
-    TODO: use isomorphisms to change the model of the curve if (0,0) is a
-    kernel point
+    - When ell is even, we use Renes (https://ia.cr/2017/1198) when the
+    kernel is not (0,0), and otherwise Vélu's formula followed by a scaling
+    to a Montgomery curve
     """
 
+    # Label of the steps in the metrics, see kummer_metrics.py
+    _algorithm = "velu"
+
+    @timed("isogeny_construction_seconds", "velu")
     def __init__(self, domain, kernel, degree, check=True):
         # Check the input to the isogeny is well-formed
         self.validate_input(domain, kernel, degree, check=check)
@@ -152,16 +543,18 @@ class KummerLineIsogeny_Velu(KummerLineIsogeny_Generic):
         self._kernel = kernel
         self._domain = domain
 
-        # Compute the codomain, we need different formula for even and
-        # odd degree
+        # For ell = 2, the evaluation function and its data depend on
+        # whether the kernel is (0 : 1)
         if self._degree == 2:
-            # We cannot use the point (0 : 0 : 1) as the kernel for
-            # these formula
-            assert self._kernel.XZ()[0]
+            self._even_step = self._precompute_even_step()
 
         # Compute the codomain
         self._codomain = self._compute_codomain()
 
+        # Data for the y-coordinate map, computed when first needed
+        self._y_data = None
+
+    @timed("isogeny_evaluation_seconds", "velu")
     def __call__(self, P):
         """
         phi(xP) evaluates the Kummer point xP
@@ -172,41 +565,83 @@ class KummerLineIsogeny_Velu(KummerLineIsogeny_Generic):
             return self._evaluate_isogeny_even(P)
         return self._evaluate_isogeny(P)
 
+    def _precompute_even_step(self):
+        """
+        Return the raw evaluation function of the 2-isogeny and its
+        data: (XK + ZK, XK - ZK) for the Renes formula, or (A + 2C, C, r)
+        with r^2 = A^2 - 4C^2 when the kernel is (0 : 1)
+        """
+        XK, ZK = self._kernel.XZ()
+        if XK:
+            return _evaluate_xz_even, (XK + ZK, XK - ZK)
+
+        # The codomain of Vélu's formula is y^2 = x(x^2 - 2ax + a^2 - 4),
+        # and scaling x by s = r/C gives a Montgomery curve
+        A, C = self._domain.extract_constants()
+        F = self._domain.base_ring()
+        r2 = F(A * A - 4 * C * C)
+        if not r2.is_square():
+            raise ValueError(
+                "A^2 - 4C^2 is not a square, the 2-isogeny with kernel (0,0) "
+                "has no Montgomery codomain over the base field"
+            )
+        r = pari(r2.sqrt())
+        return _evaluate_xz_even_origin, (A + C + C, C, r)
+
     def _precompute_edwards_multiples(self, d):
         """
         These multiples are used in both codomain
         computation and isogeny evaluation. We precompute
         them once during initialisation and we can then
         reuse them for every evaluation
+
+        The multiples [i+1]K = [i]K + K are computed with
+        differential additions which take [i]K and K directly
+        in the Edwards coordinates (Xi - Zi : Xi + Zi), so no
+        KummerPoint is constructed for the multiples
         """
-        # Compute the [i]K for i in [1...d]
-        K_muls = self._kernel.multiples()
-        E_muls = []
-        for _ in range(d):
-            Ki = next(K_muls)
-            KX, KZ = Ki.XZ()
-            YE = KX - KZ
-            ZE = KX + KZ
-            E_muls.append((YE, ZE))
+        # [1]K and [2]K
+        X1, Z1 = self._kernel.XZ()
+        Y1, W1 = X1 - Z1, X1 + Z1
+        E_muls = [(Y1, W1)]
+        if d == 1:
+            return E_muls
+
+        X_prev, Z_prev = X1, Z1
+        Xi, Zi = self._kernel.double().XZ()
+        Yi, Wi = Xi - Zi, Xi + Zi
+        E_muls.append((Yi, Wi))
+
+        # Compute the [i]K for i in [3...d]
+        for _ in range(d - 2):
+            U = Yi * W1
+            V = Wi * Y1
+            X_next = U + V
+            Z_next = U - V
+            X_next = Z_prev * X_next * X_next
+            Z_next = X_prev * Z_next * Z_next
+
+            X_prev, Z_prev, Xi, Zi = Xi, Zi, X_next, Z_next
+            Yi, Wi = Xi - Zi, Xi + Zi
+            E_muls.append((Yi, Wi))
+
         return E_muls
 
     def _compute_codomain_constants(self):
         """
         When ell is odd, we compute the codomain using the Meyer and Reith
         Twised Edwards trick (https://ia.cr/2018/782)
+
+        The constants are returned in twisted Edwards form (Aed : Ded)
         """
-        # Extract Montgomery constants
-        A, C = self._domain.extract_constants()
+        # Extract twisted Edwards constants, these are cached on the
+        # domain when it is the codomain of an odd degree step
+        Aed, Ded = self._domain.edwards_constants()
 
         # Compute and store pairs of points for later evaluation
         d = (self._degree - 1) // 2
         self._edwards_multiples = self._precompute_edwards_multiples(d)
 
-        # Convert to twisted Edwards curve parameters (Aed,Ded)
-        Ded = C + C
-        Aed = A + Ded
-        Ded = A - Ded
-
         # Compute product of Edwards multiples
         prod_Y = 1
         prod_Z = 1
@@ -214,6 +649,15 @@ class KummerLineIsogeny_Velu(KummerLineIsogeny_Generic):
             prod_Y *= EY
             prod_Z *= EZ
 
+        return self._edwards_codomain(Aed, Ded, prod_Y, prod_Z, self._degree)
+
+    @staticmethod
+    def _edwards_codomain(Aed, Ded, prod_Y, prod_Z, ell):
+        """
+        Meyer-Reith codomain of an odd degree ell isogeny from the
+        twisted Edwards curve (Aed : Ded), given the products of the
+        Edwards multiples prod_Y = prod(Xi - Zi) and prod_Z = prod(Xi + Zi)
+        """
         # compute prod_Y^8 and prod_Z^8
         prod_Y, prod_Z = prod_Y**2, prod_Z**2
         prod_Y, prod_Z = prod_Y**2, prod_Z**2
@@ -221,24 +665,25 @@ class KummerLineIsogeny_Velu(KummerLineIsogeny_Generic):
 
         # A_new = A_old^ell * prod_Z^8
         # D_new = D_old^ell * prod_Y^8
-        Aed = Aed**self._degree * prod_Z
-        Ded = Ded**self._degree * prod_Y
-
-        # Change back to Montgomery-parameters
-        A = Aed + Ded
-        C = Aed - Ded
-        A = A + A
+        Aed = Aed**ell * prod_Z
+        Ded = Ded**ell * prod_Y
 
-        return A, C
+        return Aed, Ded
 
     def _compute_codomain_constants_even(self):
         """
         When ell is even, we compute the codomain constants
-        using Renes formula
+        using Renes formula, or (A' : C') = (-2A : r) when the
+        kernel is (0 : 1)
         """
+        f, data = self._even_step
+        if f is _evaluate_xz_even_origin:
+            A2C, C, r = data
+            A = A2C - C - C
+            return -(A + A), r
+
         # Extract kernel point
         XK, ZK = self._kernel.XZ()
-        assert XK, "XK Cannot be zero"
 
         # C = ZK^2
         C = ZK * ZK
@@ -256,16 +701,18 @@ class KummerLineIsogeny_Velu(KummerLineIsogeny_Generic):
         projective coordinates: A' = (A' : C') We use different formula
         depending on whether the isogeny degree ell is even or odd
         """
+        F = self._domain.base_ring()
+
         # Compute the codomain constants, need different formula for
         # odd and even ell
         if self._degree == 2:
             A_codomain, C_codomain = self._compute_codomain_constants_even()
-        else:
-            A_codomain, C_codomain = self._compute_codomain_constants()
+            return KummerLine(F, [A_codomain, C_codomain])
 
-        # Constuct a new KummerLine
-        F = self._domain.base_ring()
-        return KummerLine(F, [A_codomain, C_codomain])
+        # For odd ell the codomain keeps its twisted Edwards constants,
+        # so the next odd step of a chain does not convert them again
+        Aed, Ded = self._compute_codomain_constants()
+        return KummerLine._from_edwards_constants(F, Aed, Ded)
 
     def _evaluate_isogeny(self, P):
         """
@@ -273,46 +720,354 @@ class KummerLineIsogeny_Velu(KummerLineIsogeny_Generic):
         evaluating an odd degree isogeny on the point P
         """
         XP, ZP = P.XZ()
-        Psum = XP + ZP
-        Pdiff = XP - ZP
+        X_new, Z_new = _evaluate_xz_odd(XP, ZP, self._edwards_multiples)
+        return self._codomain((X_new, Z_new))
+
+    def _evaluation_step(self):
+        """
+        Return the raw evaluation function and its precomputed data
+        for the evaluation plan of a chain
+        """
+        if self._degree == 2:
+            return self._even_step
+        return _evaluate_xz_odd, self._edwards_multiples
 
-        # Loop through the d-multiples, these are
-        # precomputed from the codomain computation
-        X_new, Z_new = 1, 1
+    def _precompute_y_data(self):
+        """
+        Compute the constant c and the kernel data (Xi, Zi, Zi^2 - Xi^2)
+        used in `_evaluate_xy()`
+        """
+        # For the kernel (0 : 1), the x-map is (a(x - 1)^2 + bx) / dx, so
+        # we have c^2 = 1/s with s = d/a and the data is (b/a - 2, 1/s)
+        if self._degree == 2 and self._even_step[0] is _evaluate_xz_even_origin:
+            b, a, d = self._even_step[1]
+            F = self._domain.base_ring()
+            c2 = F(a / d)
+            if not c2.is_square():
+                raise ValueError(
+                    "a/d is not a square, the image lies on a twist of the codomain"
+                )
+            c = pari(c2.sqrt())
+            return c, (b / a - 2, a / d)
+
+        # For ell = 2, we have c^2 = x(K), which is a square whenever
+        # K = [2]T for some rational T
+        if self._degree == 2:
+            XK, ZK = self._kernel.XZ()
+            F = self._domain.base_ring()
+            c2 = F(XK / ZK)
+            if not c2.is_square():
+                raise ValueError(
+                    "x(K) is not a square, the image lies on a twist of the codomain"
+                )
+            c = pari(c2.sqrt())
+            return c, [(XK, ZK, ZK * ZK - XK * XK)]
+
+        # For odd ell, we have c = prod x([i]K) for i in [1...d]
+        # and the Edwards multiples are (Xi - Zi, Xi + Zi)
+        data = []
+        num, den = 1, 1
         for EY, EZ in self._edwards_multiples:
-            diff_EZ = Pdiff * EZ
-            sum_EY = EY * Psum
-            X_new *= diff_EZ + sum_EY
-            Z_new *= diff_EZ - sum_EY
+            Xi = EY + EZ
+            Zi = EZ - EY
+            num *= Xi
+            den *= Zi
+            data.append((Xi, Zi, Zi * Zi - Xi * Xi))
+        return num / den, data
+
+    def _evaluate_xy(self, x, y):
+        """
+        Evaluate the isogeny on the affine point (x, y), returning the
+        affine image or None when the image is the identity
 
-        # Square and multiple with original
-        X_new = X_new**2 * XP
-        Z_new = Z_new**2 * ZP
+        The x-map is f(x) = x * prod(gi(x)^2) for odd ell and f(x) = x * g(x)
+        for ell = 2, where gi(x) = (x*Xi - Zi) / (x*Zi - Xi). The image is
 
-        return self._codomain((X_new, Z_new))
+            (f(x), c * y * f'(x))
+
+        where c is chosen such that the image is on the codomain with
+        B = 1. We compute f'(x) from the logarithmic derivative
+        f'/f = 1/x + sum gi'/gi, where gi'/gi = (Zi^2 - Xi^2) / (ui * vi).
+        The only inversion is of V = prod vi and no square roots are
+        needed.
+
+        For ell = 2 with kernel (0,0), the x-map is instead
+        f(x) = (x + a + 1/x) / s.
+        """
+        if self._y_data is None:
+            self._y_data = self._precompute_y_data()
+        c, data = self._y_data
+
+        if self._degree == 2 and self._even_step[0] is _evaluate_xz_even_origin:
+            # f(x) = (x + a + 1/x) / s, f'(x) = (1 - 1/x^2) / s
+            if not x:
+                return None
+            a, s_inv = data
+            x_inv = 1 / x
+            x_new = (x + a + x_inv) * s_inv
+            y_new = c * y * (1 - x_inv * x_inv) * s_inv
+            return x_new, y_new
+
+        # Accumulate U = prod ui, V = prod vi and n / UV = sum wi / (ui * vi)
+        U, V, n = 1, 1, 0
+        for Xi, Zi, wi in data:
+            ui = x * Xi - Zi
+            vi = x * Zi - Xi
+            n = n * ui * vi + wi * U * V
+            U *= ui
+            V *= vi
+
+        # x is the x-coordinate of a kernel point
+        if not V:
+            return None
+        V_inv = 1 / V
+
+        if self._degree == 2:
+            # f(x) = x*U/V, f'(x) = (UV + x*n) / V^2
+            x_new = x * U * V_inv
+            y_new = c * y * (U * V + x * n) * V_inv * V_inv
+        else:
+            # f(x) = x*U^2/V^2, f'(x) = U(UV + 2x*n) / V^3
+            UV_inv = U * V_inv
+            x_new = x * UV_inv * UV_inv
+            y_new = c * y * UV_inv * (U * V + 2 * x * n) * V_inv * V_inv
+
+        return x_new, y_new
 
     def _evaluate_isogeny_even(self, P):
         """
         Renes (https://ia.cr/2017/1198) formula for
-        evaluating an even degree isogeny on the point P
+        evaluating an even degree isogeny on the point P, or
+        Vélu's formula when the kernel is (0 : 1)
         """
-        XK, ZK = self._kernel.XZ()
-        assert XK, "XK cannot be zero"
+        f, data = self._even_step
+        XP, ZP = P.XZ()
+        return self._codomain(f(XP, ZP, data))
+
+    def _dual_from_kernel(self, K):
+        """
+        Compute the dual isogeny from a generator K of its kernel.
+
+        For ell = 2, Vélu's formula for the kernel (0 : 1) would give
+        a codomain (-2A' : r') for a square root r' chosen by the base
+        field, which is isomorphic to, but not equal to, the domain.
+        Instead, we write down the x-map of the dual. For the Renes
+        step with kernel (XK : ZK), the dual has kernel (0 : 1) and is
+
+            (ZK(X + Z)^2 : 4XK*XZ)
+
+        For a step with kernel (0 : 1) and x-map (a(X - Z)^2 + bXZ : dXZ)
+        from (A : C), let u = (b - 2a)C - aA. When u = 0, the dual has
+        kernel (0 : 1) and is
+
+            (dC(X - Z)^2 + 2(dC - aA)XZ : 4aC*XZ)
+
+        and otherwise the dual is the Renes step with kernel (u : dC).
+        In all cases the codomain of the dual is exactly the domain.
+        """
+        if self._degree != 2:
+            return super()._dual_from_kernel(K)
+
+        f, data = self._even_step
+        if f is _evaluate_xz_even:
+            XK, ZK = self._kernel.XZ()
+            dual_data = (4 * ZK, ZK, 4 * XK)
+        else:
+            A, C = self._domain.extract_constants()
+            b, a, d = data
+            aA, dC = a * A, d * C
+            u = (b - a - a) * C - aA
+            if u:
+                return type(self)(self._codomain, self._codomain((u, dC)), 2, check=False)
+            dual_data = (2 * (dC - aA), dC, 4 * a * C)
+
+        # The constructor would recompute the codomain with a square
+        # root, so the step is assembled from its evaluation data
+        psi = type(self).__new__(type(self))
+        psi._degree = self._degree
+        psi._kernel = K
+        psi._domain = self._codomain
+        psi._codomain = self._domain
+        psi._even_step = (_evaluate_xz_even_origin, dual_data)
+        psi._y_data = None
+        return psi
+
+
+# =================================================== #
+# Isogenies defined over the base field with kernels  #
+# over an extension, using Frobenius orbits           #
+# =================================================== #
 
+
+class KummerLineIsogeny_VeluExtension(KummerLineIsogeny_Generic):
+    """
+    Computes odd degree isogenies defined over the base field GF(q) of
+    the domain, when the kernel point is only defined over an extension
+    GF(q^k). The kernel is given as a point on the Kummer Line of the
+    same curve over the extension, and its subgroup must be stable under
+    Frobenius.
+
+    The Costello-Hisil factors of the multiples [i]K are permuted by
+    Frobenius, so the product of the factors over each Frobenius orbit
+    is a form in (XP - ZP, XP + ZP) with coefficients in GF(q). These
+    forms are computed once in the extension and give both the codomain
+    and the image of points with arithmetic in GF(q) only.
+    """
+
+    # Label of the steps in the metrics, see kummer_metrics.py
+    _algorithm = "velu_extension"
+
+    @timed("isogeny_construction_seconds", "velu_extension")
+    def __init__(self, domain, kernel, degree, check=True):
+        # Check the input to the isogeny is well-formed
+        self._embedding = self.validate_extension_input(
+            domain, kernel, degree, check=check
+        )
+
+        # Set kernel and degree and domain
+        self._degree = Integer(degree)
+        self._kernel = kernel
+        self._domain = domain
+
+        # Compute the forms over each Frobenius orbit and the codomain
+        self._orbit_polynomials = self._precompute_orbit_polynomials()
+        self._codomain = self._compute_codomain()
+
+    @staticmethod
+    def validate_extension_input(domain, kernel, degree, check=True):
+        """
+        Check the kernel lies on the Kummer Line of the domain over an
+        extension of its base field, and return the embedding of the
+        base field into the extension (None when they are equal)
+        """
+        if not isinstance(domain, KummerLine):
+            raise ValueError(f"not a kummer line: {domain}")
+
+        if not isinstance(kernel, KummerPoint):
+            raise ValueError(f"not a kummer point: {kernel}")
+
+        if degree % 2 == 0:
+            raise ValueError("Only odd degree isogenies are supported")
+
+        F = domain.base_ring()
+        L = kernel.parent()
+        F_ext = L.base_ring()
+        if F_ext == F:
+            embedding = None
+            if L != domain:
+                raise ValueError(f"Kernel {kernel} is not a point on {domain}")
+        else:
+            embedding = F_ext.coerce_map_from(F)
+            if embedding is None:
+                raise ValueError(f"{F} does not embed into {F_ext}")
+            if embedding(F(domain.a())) != F_ext(L.a()):
+                raise ValueError(f"Kernel {kernel} is not a point on {domain}")
+
+        if check:
+            if not kernel.has_order(degree):
+                raise ValueError("Input point does not have correct order")
+
+        return embedding
+
+    @timed("isogeny_evaluation_seconds", "velu_extension")
+    def __call__(self, P):
+        """
+        phi(xP) evaluates the Kummer point xP of the domain
+        """
+        if not isinstance(P, KummerPoint):
+            raise ValueError
         XP, ZP = P.XZ()
+        X_new, Z_new = _evaluate_xz_orbits(XP, ZP, self._orbit_polynomials)
+        return self._codomain((X_new, Z_new))
 
-        T0 = XK + ZK
-        T1 = XK - ZK
-        T2 = XP + ZP
-        T3 = ZP - XP  # Typo in formula: paper says XP - ZP
-        T4 = T3 * T0  # (ZP - XP)(XK + ZK)
-        T5 = T2 * T1  # (XP + ZP)(XK - ZK)
-        T6 = T4 - T5  # (ZP - XP)(XK + ZK) - (XP + ZP)(XK - ZK)
-        T7 = T4 + T5  # (ZP - XP)(XK + ZK) + (XP + ZP)(XK - ZK)
-        T8 = XP * T6  # XP * ((ZP - XP)(XK + ZK) - (XP + ZP)(XK - ZK))
-        T9 = ZP * T7  # ZP * ((ZP - XP)(XK + ZK) + (XP + ZP)(XK - ZK))
+    def _frobenius_orbits(self, d):
+        """
+        Compute the affine x-coordinates of [i]K for i in [1...d] and
+        group them into orbits under x -> x^q
+        """
+        K_muls = self._kernel.multiples()
+        XZ = [next(K_muls).XZ() for _ in range(d)]
+        Z_invs = batch_inversion([Z for _, Z in XZ])
+        xs = [X * Z_inv for (X, _), Z_inv in zip(XZ, Z_invs)]
+
+        q = self._domain.base_ring().order()
+        index = {x: i for i, x in enumerate(xs)}
+        seen = [False] * d
+        orbits = []
+        for i, x in enumerate(xs):
+            if seen[i]:
+                continue
+            orbit = [x]
+            seen[i] = True
+            x_conj = x**q
+            while x_conj != x:
+                j = index.get(x_conj)
+                if j is None:
+                    raise ValueError(
+                        "The kernel is not stable under Frobenius, the isogeny "
+                        "is not defined over the base field"
+                    )
+                orbit.append(x_conj)
+                seen[j] = True
+                x_conj = x_conj**q
+            orbits.append(orbit)
+        return orbits
+
+    def _precompute_orbit_polynomials(self):
+        """
+        For each Frobenius orbit, compute the coefficients of
+        prod((xi + 1) U + (xi - 1) V), which lie in the base field
+        """
+        d = (self._degree - 1) // 2
+        F = self._domain.base_ring()
+        F_ext = self._kernel.parent().base_ring()
+        section = None if self._embedding is None else self._embedding.section()
+
+        orbit_polynomials = []
+        for orbit in self._frobenius_orbits(d):
+            coeffs = [1]
+            for x in orbit:
+                EY, EZ = x - 1, x + 1
+                coeffs = (
+                    [EZ * coeffs[0]]
+                    + [EZ * c1 + EY * c0 for c0, c1 in zip(coeffs, coeffs[1:])]
+                    + [EY * coeffs[-1]]
+                )
+            if section is not None:
+                coeffs = [pari(F(section(F_ext(c)))) for c in coeffs]
+            orbit_polynomials.append(coeffs)
+        return orbit_polynomials
 
-        return self._codomain((T8, T9))
+    def _compute_codomain(self):
+        """
+        Compute the codomain with the Meyer-Reith formula, where the
+        products of the Edwards multiples are the leading and constant
+        coefficients of the orbit forms
+        """
+        Aed, Ded = self._domain.edwards_constants()
+        prod_Y = 1
+        prod_Z = 1
+        for coeffs in self._orbit_polynomials:
+            prod_Z *= coeffs[0]
+            prod_Y *= coeffs[-1]
+
+        Aed, Ded = KummerLineIsogeny_Velu._edwards_codomain(
+            Aed, Ded, prod_Y, prod_Z, self._degree
+        )
+        F = self._domain.base_ring()
+        return KummerLine._from_edwards_constants(F, Aed, Ded)
+
+    def _evaluation_step(self):
+        """
+        Return the raw evaluation function and its precomputed data
+        for the evaluation plan of a chain
+        """
+        return _evaluate_xz_orbits, self._orbit_polynomials
+
+    def _evaluate_xy(self, x, y):
+        raise NotImplementedError(
+            "y-coordinates are not supported for kernels over an extension"
+        )
 
 
 # ==================================================== #
@@ -330,6 +1085,8 @@ def product_tree_resultant(hI_tree, poly):
 
     Original author: Lorenz Panny (2022)
     """
+    from sage.misc.misc_c import prod
+
     rems = hI_tree.remainders(poly)
     r = prod(rems)
     s = -1 if len(hI_tree) % 2 == 1 == poly.degree() else 1
@@ -351,6 +1108,20 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
     computations though.
     """
 
+    # `evaluate_many()` only uses the matrix evaluation when ell is at
+    # most EVALUATE_MANY_MAX_DEGREE, as it costs O(ell) per point, and
+    # for at least EVALUATE_MANY_MIN_POINTS points. Otherwise the points
+    # are evaluated one at a time. These can be tuned with
+    # `print_evaluate_many_comparison()` in benchmark.py, which shows
+    # the matrix evaluation is faster for two or more points for every
+    # degree of the FESTA parameters, up to ell = 41161
+    EVALUATE_MANY_MAX_DEGREE = 50000
+    EVALUATE_MANY_MIN_POINTS = 2
+
+    # Label of the steps in the metrics, see kummer_metrics.py
+    _algorithm = "velusqrt"
+
+    @timed("isogeny_construction_seconds", "velusqrt")
     def __init__(self, domain, kernel, degree, check=True):
         # Check the input to the isogeny is well-formed
         self.validate_input(domain, kernel, degree, check=check)
@@ -366,6 +1137,10 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
 
         # We need a polynomial ring, so we create it once
         # and store it to self
+        from sage.rings.polynomial.polynomial_ring_constructor import (
+            PolynomialRing,
+        )
+
         k = self._domain.base_ring()
         self.R = PolynomialRing(k, names="Z", implementation="NTL")
         self.Z = self.R.gen()
@@ -376,7 +1151,7 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
         self.Ra = self.R(self.a)
 
         # baby step and giant step params
-        b = (self._degree - 1).isqrt() // 2
+        b = math.isqrt(self._degree - 1) // 2
         c = (self._degree - 1) // (4 * b)
         stop = self._degree - 4 * b * c
 
@@ -384,12 +1159,21 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
         # throughout. hI is stored as a product tree
         # for faster resultants
         self.hI_tree = self._hI_precomputation(kernel, b, c)
-        self.EJ_parts = self._EJ_precomputation(kernel, b)
+        self.EJ_coeffs = self._EJ_precomputation(kernel, b)
         self.hK_data = self._hK_precomputation(kernel, stop)
 
         # Compute the codomain
         self._codomain = self._compute_codomain()
 
+        # Reference point and its image for the y-coordinate map,
+        # computed when first needed
+        self._y_reference = None
+
+        # Matrices for the resultants of many points at once, used by
+        # `_evaluate_many_matrix()` and computed when first needed
+        self._resultant_data = None
+
+    @timed("isogeny_evaluation_seconds", "velusqrt")
     def __call__(self, P):
         """
         Evaluate the isogeny phi on the point P
@@ -426,6 +1210,8 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
             if i < c - 1:
                 Q, diff = Q.add(step, diff), Q
 
+        from sage.rings.generic import ProductTree
+
         return ProductTree(leaves)
 
     # def _Fs(self, X1, X2):
@@ -508,27 +1294,38 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
 
     def _EJ_precomputation(self, ker, b):
         """
-        The polynomials for EJ are of the form
+        The polynomial EJ is the product of the factors
 
         alpha^2 * F0(Z, x(Q)) + alpha * F1(Z, x(Q)) + F2(Z, x(Q))
 
         For x(Q) in the set J = {1, 3, 5, ..., 2b - 1}
 
-        We cannot precompute the whole polynomial, but we can precompute
-        the pieces Fi(Z, x(Q)) and then compute the sum when needed
+        As each factor is quadratic in alpha, we precompute the whole
+        product once as a polynomial in alpha with coefficients in R,
+        computed with a product tree. We return the list of coefficients
+        Gk(Z) of alpha^k, so that an image only needs to substitute
+        alpha with Horner's method rather than recompute the product.
         """
+        from sage.misc.misc_c import prod
+        from sage.rings.polynomial.polynomial_ring_constructor import (
+            PolynomialRing,
+        )
+
+        S = PolynomialRing(self.R, names="alpha")
+
         Q = ker
         step, diff = Q.double(), Q
-        EJ_parts = []
+        EJ_factors = []
         # This uses x-only point addition to generate all points
         # in the set J = {1, 3, 5, ..., 2b - 1}
         for i in range(b):
-            polys = self._Fs(Q.x())
-            EJ_parts.append(polys)
+            F0, F1, F2 = self._Fs(Q.x())
+            EJ_factors.append(S([F2, F1, F0]))
             if i < b - 1:
                 Q, diff = Q.add(step, diff), Q
 
-        return EJ_parts
+        # Sage's prod multiplies the factors with a balanced tree
+        return prod(EJ_factors).list()
 
     def _hK_precomputation(self, ker, stop):
         r"""
@@ -571,9 +1368,12 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
         (A : C) using the VéluSqrt adaptation of the Meyers-Reith
         Twisted Edwards curve trick
         """
-        # These are the polynomials for alpha = 1 and alpha = -1
-        E0J = prod(F0 + F1 + F2 for F0, F1, F2 in self.EJ_parts)
-        E1J = prod(F0 - F1 + F2 for F0, F1, F2 in self.EJ_parts)
+        # These are the polynomials for alpha = 1 and alpha = -1,
+        # the sum and alternating sum of the coefficients of EJ
+        EJ_even = sum(self.EJ_coeffs[::2])
+        EJ_odd = sum(self.EJ_coeffs[1::2])
+        E0J = EJ_even + EJ_odd
+        E1J = EJ_even - EJ_odd
 
         # Compute resultants and evaluate hK at 1 and -1
         R0 = self._hI_resultant(E0J)
@@ -640,12 +1440,23 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
         if P.is_zero():
             return self._codomain((1, 0))
 
+        X, Z = P.XZ()
+        return self._codomain(self._evaluate_xz(X, Z))
+
+    def _evaluate_xz(self, X, Z):
+        """
+        Evaluate the isogeny on (X : Z) with Z non-zero, see
+        `_evaluate_isogeny()`
+        """
         # x-coordinate of point to evaluate
-        alpha = pari(P.x())
+        alpha = X / Z
         alphaR = self.R(alpha)
 
-        # Compute two polynomials from giant steps
-        EJ1 = prod((F0 * alphaR + F1) * alphaR + F2 for F0, F1, F2 in self.EJ_parts)
+        # Compute two polynomials from giant steps, substituting
+        # alpha into the precomputed EJ with Horner's method
+        EJ1 = self.EJ_coeffs[-1]
+        for G in reversed(self.EJ_coeffs[:-1]):
+            EJ1 = EJ1 * alphaR + G
         EJ0 = EJ1.reverse()
 
         # Resultants and evaluations
@@ -659,7 +1470,239 @@ class KummerLineIsogeny_VeluSqrt(KummerLineIsogeny_Generic):
         X_new = R0M0 * R0M0 * alpha
         Z_new = R1M1 * R1M1
 
-        return self._codomain((X_new, Z_new))
+        return X_new, Z_new
+
+    def _evaluation_step(self):
+        """
+        Return the raw evaluation function and its data for the
+        evaluation plan of a chain
+        """
+        return _evaluate_xz_sqrt, self
+
+    def _resultant_matrices(self):
+        """
+        Compute the pari matrices (H, D, J) used to evaluate the factors
+        of EJ at the roots x_i of hI for many points at once
+
+        As a polynomial in Z, each factor of EJ1 for x(Q) = x in J is
+
+            u Z^2 + v Z + w = (alpha - x)^2 Z^2
+                              - 2((alpha^2 + 1) x + alpha (x^2 + 2Ax + 1)) Z
+                              + (x alpha - 1)^2
+
+        and the factor of EJ0 swaps u and w. So twice the factors of EJ1
+        and EJ0 at x_i are
+
+            (u + w)(x_i^2 + 1) + 2v x_i +/- (u - w)(x_i^2 - 1)
+
+        where u + w, 2v and u - w are linear in the values of the
+        columns (x^2 + 1, x, x^2 + 2Ax + 1, 1 - x^2) of J. The rows of H
+        are (x_i^2 + 1, x_i) and D is the column of the x_i^2 - 1.
+        Computed once for the isogeny.
+        """
+        if self._resultant_data is None:
+            k = self._domain.base_ring()
+            A = pari(self.a)
+
+            H, D = [], []
+            for leaf in self.hI_tree.leaves():
+                x = pari(-k(leaf[0]))
+                x2 = x * x
+                H.extend((x2 + 1, x))
+                D.append(x2 - 1)
+
+            # The x-coordinates of the points in J = {1, 3, ..., 2b - 1},
+            # as in `_EJ_precomputation()`
+            b = len(self.EJ_coeffs) // 2
+            Q = self._kernel
+            step, diff = Q.double(), Q
+            xs = []
+            for i in range(b):
+                xs.append(Q.x())
+                if i < b - 1:
+                    Q, diff = Q.add(step, diff), Q
+            J = [x * x + 1 for x in xs]
+            J += xs
+            J += [x * (x + A + A) + 1 for x in xs]
+            J += [1 - x * x for x in xs]
+
+            self._resultant_data = (
+                pari.matrix(len(D), 2, H),
+                pari.Col(D),
+                pari.matrix(4, b, J),
+            )
+        return self._resultant_data
+
+    @timed("isogeny_evaluation_seconds", "velusqrt")
+    def evaluate_many(self, points):
+        """
+        Evaluate the isogeny on a list of points, with the matrix
+        evaluation of `_evaluate_many_matrix()` for large enough batches
+        and small enough ell, and phi(P) for each point otherwise
+        """
+        points = list(points)
+        for P in points:
+            if not isinstance(P, KummerPoint) or P.parent() != self._domain:
+                raise ValueError(f"{P} is not a point on {self._domain}")
+
+        if not self._use_matrix_evaluation(len(points)):
+            return [self._evaluate_isogeny(P) for P in points]
+        return self._evaluate_many_matrix(points)
+
+    def _use_matrix_evaluation(self, m):
+        """
+        Whether to evaluate m points with `_evaluate_many_matrix()`
+        """
+        if self._degree > self.EVALUATE_MANY_MAX_DEGREE:
+            return False
+        return m >= self.EVALUATE_MANY_MIN_POINTS
+
+    def _evaluate_many_matrix(self, points):
+        """
+        Evaluate the isogeny on a list of points together, sharing the
+        substitution into EJ and the resultant computations between the
+        points
+
+        As hI = prod(Z - x_i) and the x_i are known, the resultants are
+        computed by evaluation at the roots of hI, and as EJ1 is the
+        product of one factor for each x(Q) in J,
+
+            Res(hI, EJ1) = prod EJ1(x_i) = prod prod factor_Q(x_i)
+
+        and similarly for EJ0, the reverse of EJ1 in Z, whose factors are
+        the reversed factors of EJ1.
+
+        Rather than substituting each alpha into EJ and computing the
+        resultants with the remainder tree of hI, the factors are
+        evaluated at all the x_i for all the points together, see
+        `_resultant_matrices()`: the coefficients in Z of the factors of
+        all the points are one matrix product each, and their values at
+        the x_i for EJ1 and EJ0 are two matrix products shared by all
+        the points, with three multiplications for each root of hI and
+        point of J. All the alpha are computed with a
+        single inversion.
+        """
+        XZ = [P.XZ() for P in points]
+        images = [(1, 0)] * len(points)
+
+        # Points at infinity map to infinity, compute the x-coordinates
+        # of all other points with a single inversion
+        finite = [i for i, (_, Z) in enumerate(XZ) if Z]
+        if finite:
+            Z_invs = batch_inversion([XZ[i][1] for i in finite])
+            alphas = [XZ[i][0] * Z_inv for i, Z_inv in zip(finite, Z_invs)]
+            for i, XZ_new in zip(finite, self._evaluate_alphas(alphas)):
+                images[i] = XZ_new
+
+        return [self._codomain(XZ_new) for XZ_new in images]
+
+    def _evaluate_alphas(self, alphas):
+        """
+        Evaluate the isogeny on the affine x-coordinates alphas, see
+        `evaluate_many()`
+        """
+        H, D, J = self._resultant_matrices()
+        b = len(self.EJ_coeffs) // 2
+
+        # The values u + w, 2v and u - w of each point, with a column for
+        # each x in J
+        blocks_sum, blocks_diff = [], []
+        for alpha in alphas:
+            alpha2 = alpha * alpha
+            s = alpha2 + 1
+            m4alpha = -4 * alpha
+            C_sum = pari.matrix(2, 4, [s, m4alpha, 0, 0, 0, -4 * s, m4alpha, 0])
+            C_diff = pari.matrix(1, 4, [0, 0, 0, alpha2 - 1])
+            blocks_sum.append(C_sum * J)
+            blocks_diff.append(C_diff * J)
+
+        # Twice the factors of EJ1 and EJ0 at all roots of hI, the
+        # factors of 2 cancel in the image. The resultants are the
+        # products of the entries of the columns of each point
+        E_sum = H * pari.matconcat(blocks_sum)
+        E_diff = D * pari.matconcat(blocks_diff)
+        E1 = E_sum + E_diff
+        E0 = E_sum - E_diff
+
+        images = []
+        for j, alpha in enumerate(alphas):
+            R0, R1 = 1, 1
+            for t in range(j * b, (j + 1) * b):
+                R0 *= pari.vecprod(E0[t])
+                R1 *= pari.vecprod(E1[t])
+            M0, M1 = self._hK_image(alpha)
+
+            # Make new point
+            R0M0 = R0 * M0
+            R1M1 = R1 * M1
+            images.append((R0M0 * R0M0 * alpha, R1M1 * R1M1))
+
+        return images
+
+    def _compute_y_reference(self):
+        """
+        Find a point R on the domain and fix the full image phi(R),
+        the choice of sign of the y-coordinate of phi(R) fixes the
+        sign of the isogeny for all later evaluations
+        """
+        F = self._codomain.base_ring()
+        a = self._codomain.a()
+        for xR in self._domain.sample_points():
+            xR_img = self(xR)
+            if xR_img.is_zero():
+                continue
+
+            # We need an image with y != 0 for y-recovery
+            x_img = pari(xR_img.x())
+            y2 = F(x_img * (x_img * (x_img + a) + 1))
+            if not y2:
+                continue
+
+            R = xR.curve_point()
+            return (R, (x_img, pari(y2.sqrt())))
+
+    def _evaluate_xy(self, x, y):
+        """
+        Evaluate the isogeny on the affine point (x, y), returning the
+        affine image or None when the image is the identity
+
+        We do not have an explicit y-map for VéluSqrt, so instead we use
+        a reference point R with known image R' = phi(R). Computing Q + R
+        on the domain and the x-only images of Q and Q + R, we can recover
+        phi(Q) from R', x(phi(Q)) and x(R' + phi(Q)) with Okeya-Sakurai.
+
+        This costs one square root per isogeny (for R') and two x-only
+        evaluations per point
+        """
+        if self._y_reference is None:
+            self._y_reference = self._compute_y_reference()
+        R, (xR_img, yR_img) = self._y_reference
+
+        E = self._domain.curve()
+        F = self._domain.base_ring()
+        Q = E(F(x), F(y))
+
+        # Deal with Q = R and Q = -R
+        if Q == R:
+            return xR_img, yR_img
+        if Q == -R:
+            return xR_img, -yR_img
+
+        xQ_img = self(self._domain((x, 1)))
+        if xQ_img.is_zero():
+            return None
+
+        # phi(Q) + R' is the identity, so phi(Q) = -R'
+        S = Q + R
+        xS_img = self(self._domain((S[0], S[2])))
+        if xS_img.is_zero():
+            return xR_img, -yR_img
+
+        X, Y, Z = self._codomain._recover_y_projective(
+            xR_img, yR_img, *xQ_img.XZ(), *xS_img.XZ()
+        )
+        Z_inv = 1 / Z
+        return X * Z_inv, Y * Z_inv
 
 
 # =============================================== #
@@ -681,13 +1724,20 @@ def evaluate_factored_kummer_isogeny(phi_list, P):
     return P
 
 
-def factored_kummer_isogeny(K, P, order, threshold=1000):
+def factored_kummer_isogeny(
+    K, P, order, threshold=1000, factorization=None, interrupt=None
+):
     """
     Computes a composite degree isogeny using x-only formula
 
     - Uses the sparse strategy from the SIDH paper for computing
       prime power degree isogenies
     - Uses VéluSqrt when the prime order isogeny has degree > threshold
+    - Uses radicals to find the kernels of chains of degree 3, 5 or 7
+      when these are the unique rational path, see kummer_radical.py
+    - The factorisation of `order` can be supplied to avoid computing it
+    - When supplied, `interrupt()` is called before each step, and can
+      raise an exception to abandon the chain
     """
 
     def sparse_isogeny_prime_power(P, l, e, split=0.8, threshold=1000):
@@ -705,6 +1755,8 @@ def factored_kummer_isogeny(K, P, order, threshold=1000):
         def recursive_sparse_isogeny(Q, k):
             assert k
             if k == 1:  # base case
+                if interrupt is not None:
+                    interrupt()
                 return [KummerLineIsogenyAlgorithm(Q.parent(), Q, l, check=False)]
 
             k1 = int(k * split + 0.5)
@@ -720,13 +1772,16 @@ def factored_kummer_isogeny(K, P, order, threshold=1000):
 
         return recursive_sparse_isogeny(P, e)
 
+    # Imported here, as kummer_radical uses the Vélu isogenies of this module
+    from kummer_radical import radical_kummer_isogeny, use_radical_chain
+
     # Ensure P is a point on E
     if P.parent() != K:
         raise ValueError(f"The supplied kernel must be a point on the line {K}")
 
-    # For computing points
-    cofactor = order
-    assert (P * order).is_zero()
+    # For computing points, we assume P has exact order `order`,
+    # which is verified by KummerLineIsogeny when check=True
+    cofactor = Integer(order)
 
     # TODO: Deal with isomorphisms
     # Easy option: just use the Sage isomorphisms from K.curve() and map down
@@ -736,16 +1791,30 @@ def factored_kummer_isogeny(K, P, order, threshold=1000):
             "Isomorphisms between Kummer Lines are not yet implemented"
         )
 
+    if factorization is None:
+        factorization = cofactor.factor()
+    factorization = sorted((Integer(l), e) for l, e in factorization)
+
     phi_list = []
-    for l, e in cofactor.factor():
+    for l, e in factorization:
         if l < 2 * threshold:
             # Compute point Q of order l^e
-            D = ZZ(l**e)
+            D = Integer(l**e)
             cofactor //= D
 
             # Use Q as kernel of degree l^e isogeny
             Q = cofactor * P
-            psi_list = sparse_isogeny_prime_power(Q, l, e, threshold=threshold)
+            if use_radical_chain(Q, l, e):
+                # The kernels of the steps are found with radicals, and
+                # when this stops early the chain is finished as usual
+                psi_list = radical_kummer_isogeny(Q, l, e, interrupt=interrupt)
+                if len(psi_list) < e:
+                    Q = evaluate_factored_kummer_isogeny(psi_list, Q)
+                    psi_list += sparse_isogeny_prime_power(
+                        Q, l, e - len(psi_list), threshold=threshold
+                    )
+            else:
+                psi_list = sparse_isogeny_prime_power(Q, l, e, threshold=threshold)
 
             # For the last step, we don't need to put the kernel
             # through the isogeny.
@@ -775,6 +1844,8 @@ def factored_kummer_isogeny(K, P, order, threshold=1000):
         # resultants is so large that log(D/ell) xDBLADD is cheaper.
         else:
             for _ in range(e):
+                if interrupt is not None:
+                    interrupt()
                 cofactor //= l
                 Q = cofactor * P
                 psi = KummerLineIsogeny_VeluSqrt(Q.parent(), Q, l)
@@ -787,6 +1858,275 @@ def factored_kummer_isogeny(K, P, order, threshold=1000):
     return phi_list
 
 
+def factored_kummer_isogeny_images(
+    K, P, order, points, threshold=1000, factorization=None
+):
+    """
+    Computes the codomain of a composite degree isogeny using x-only
+    formula together with the images of `points`, without storing the
+    chain of prime degree isogenies
+
+    - Each prime degree isogeny is evaluated on the points as soon as
+      it has been computed and is then discarded, so at most one step
+      is held in memory at a time
+    - Uses the same sparse strategy, radical chains and VéluSqrt
+      threshold as `factored_kummer_isogeny`, but the sparse strategy
+      is walked with a stack of kernel multiples rather than by recursion
+    """
+
+    def sparse_images_prime_power(P, l, e, points, split=0.8):
+        """
+        Compute the codomain of the isogeny quotienting out a point
+        P of order l**e and push the points through each step
+        """
+        if l > threshold:
+            KummerLineIsogenyAlgorithm = KummerLineIsogeny_VeluSqrt
+        else:
+            KummerLineIsogenyAlgorithm = KummerLineIsogeny_Velu
+
+        # The stack holds pairs (Q, k) where Q has order l^k, this
+        # matches the order of the recursion in the sparse strategy
+        # of `factored_kummer_isogeny`
+        stack = [(P, e)]
+        while stack:
+            Q, k = stack[-1]
+            while k > 1:
+                k1 = int(k * split + 0.5)
+                k1 = max(1, min(k - 1, k1))  # clamp to [1, k-1]
+                Q = l**k1 * Q
+                k -= k1
+                stack.append((Q, k))
+
+            # Q now has order l, compute the step and push every
+            # remaining point through it before dropping it
+            stack.pop()
+            psi = KummerLineIsogenyAlgorithm(Q.parent(), Q, l, check=False)
+            images = psi.evaluate_many([R for R, _ in stack] + points)
+            stack = [(R, k - 1) for R, (_, k) in zip(images, stack)]
+            points = images[len(stack) :]
+
+        return psi.codomain(), points
+
+    def radical_images_prime_power(P, l, e, points):
+        """
+        Compute the codomain of the isogeny quotienting out a point
+        P of order l**e with `radical_kummer_isogeny()` and push the
+        points through each step. The steps of degree at most 7 are
+        small, so they are kept in case the chain stops early.
+        """
+        psi_list = radical_kummer_isogeny(P, l, e)
+        for psi in psi_list:
+            points = psi.evaluate_many(points)
+        if len(psi_list) < e:
+            P = evaluate_factored_kummer_isogeny(psi_list, P)
+            return sparse_images_prime_power(P, l, e - len(psi_list), points)
+        return psi_list[-1].codomain(), points
+
+    # Imported here, as kummer_radical uses the Vélu isogenies of this module
+    from kummer_radical import radical_kummer_isogeny, use_radical_chain
+
+    # Ensure P is a point on E
+    if P.parent() != K:
+        raise ValueError(f"The supplied kernel must be a point on the line {K}")
+
+    # For computing points, we assume P has exact order `order`,
+    # which is verified by KummerLineIsogeny when check=True
+    cofactor = Integer(order)
+
+    if cofactor == 1:
+        raise NotImplementedError(
+            "Isomorphisms between Kummer Lines are not yet implemented"
+        )
+
+    if factorization is None:
+        factorization = cofactor.factor()
+    factorization = sorted((Integer(l), e) for l, e in factorization)
+
+    codomain = K
+    points = list(points)
+    for l, e in factorization:
+        if l < 2 * threshold:
+            # Compute point Q of order l^e
+            D = Integer(l**e)
+            cofactor //= D
+            Q = cofactor * P
+            if use_radical_chain(Q, l, e):
+                images_prime_power = radical_images_prime_power
+            else:
+                images_prime_power = sparse_images_prime_power
+
+            # The kernel only needs to be pushed through when there
+            # are further factors left to quotient out
+            if cofactor != 1:
+                codomain, (P, *points) = images_prime_power(Q, l, e, [P] + points)
+            else:
+                codomain, points = images_prime_power(Q, l, e, points)
+
+        # See `factored_kummer_isogeny` for why large l are handled
+        # one step at a time from the original kernel
+        else:
+            for _ in range(e):
+                cofactor //= l
+                Q = cofactor * P
+                psi = KummerLineIsogeny_VeluSqrt(Q.parent(), Q, l)
+
+                # Evaluate the kernel and the points together, sharing
+                # the resultant computations
+                if cofactor != 1:
+                    P, *points = psi.evaluate_many([P] + points)
+                else:
+                    points = psi.evaluate_many(points)
+                codomain = psi.codomain()
+
+    return codomain, points
+
+
+# =============================================== #
+# Bounded LRU cache of computed isogeny chains    #
+# =============================================== #
+
+IsogenyCacheInfo = namedtuple(
+    "IsogenyCacheInfo",
+    ["hits", "misses", "maxsize", "currsize", "max_steps", "steps"],
+)
+
+
+class KummerLineIsogenyCache:
+    """
+    Bounded LRU cache of the steps of isogeny chains computed by
+    KummerLineIsogeny, keyed by the canonical encodings of the domain
+    and the kernel together with the degree.
+
+    The cache holds at most `maxsize` chains and at most `max_steps` steps
+    summed over all chains, evicting the least recently used chains first.
+    Either bound can be None for no limit.
+    """
+
+    def __init__(self, maxsize=128, max_steps=None):
+        self._maxsize = maxsize
+        self._max_steps = max_steps
+        self._cache = OrderedDict()
+        self._steps = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"Kummer Line isogeny cache with {self.cache_info()}"
+
+    @staticmethod
+    def key(domain, kernel, degree, threshold=1500):
+        """
+        Canonical key for the isogeny with the given domain, kernel and
+        degree, which is the same for all projective representations.
+        The steps of degree larger than threshold use VéluSqrt, so the
+        threshold is part of the key.
+        """
+        return (
+            domain.base_ring(),
+            domain.canonical_key(),
+            kernel.canonical_key(),
+            Integer(degree),
+            Integer(threshold),
+        )
+
+    def get(self, key):
+        """
+        Return the cached steps for key, or None when the chain
+        has not been computed
+        """
+        with self._lock:
+            phis = self._cache.get(key)
+            registry = metrics()
+            if phis is None:
+                self._misses += 1
+                if registry is not None:
+                    registry.increment("isogeny_cache_misses_total")
+                return None
+            self._hits += 1
+            if registry is not None:
+                registry.increment("isogeny_cache_hits_total")
+            self._cache.move_to_end(key)
+            return phis
+
+    def put(self, key, phis):
+        """
+        Store the steps of a chain, evicting the least recently used
+        chains until the cache is within its bounds
+        """
+        phis = tuple(phis)
+        if self._max_steps is not None and len(phis) > self._max_steps:
+            return
+
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._steps -= len(old)
+            self._cache[key] = phis
+            self._steps += len(phis)
+
+            while (self._maxsize is not None and len(self._cache) > self._maxsize) or (
+                self._max_steps is not None and self._steps > self._max_steps
+            ):
+                _, evicted = self._cache.popitem(last=False)
+                self._steps -= len(evicted)
+
+    def cache_info(self):
+        """
+        Return the hit and miss statistics and the current size
+        of the cache
+        """
+        return IsogenyCacheInfo(
+            self._hits,
+            self._misses,
+            self._maxsize,
+            len(self._cache),
+            self._max_steps,
+            self._steps,
+        )
+
+    def cache_clear(self):
+        """
+        Remove all entries from the cache and reset the statistics
+        """
+        with self._lock:
+            self._cache.clear()
+            self._steps = 0
+            self._hits = 0
+            self._misses = 0
+
+
+# The cache used by KummerLineIsogeny, disabled until enabled with
+# `enable_isogeny_cache()`
+_isogeny_cache = None
+
+
+def enable_isogeny_cache(maxsize=128, max_steps=None):
+    """
+    Enable the cache of isogeny chains used by KummerLineIsogeny,
+    replacing any previous cache, and return it
+    """
+    global _isogeny_cache
+    _isogeny_cache = KummerLineIsogenyCache(maxsize=maxsize, max_steps=max_steps)
+    return _isogeny_cache
+
+
+def disable_isogeny_cache():
+    """
+    Disable the cache of isogeny chains used by KummerLineIsogeny
+    """
+    global _isogeny_cache
+    _isogeny_cache = None
+
+
+def isogeny_cache():
+    """
+    Return the cache used by KummerLineIsogeny, or None when
+    caching is disabled
+    """
+    return _isogeny_cache
+
+
 class KummerLineIsogeny(KummerLineIsogeny_Generic):
     """
     Computes composite degree isogenies as a chain of prime
@@ -794,28 +2134,198 @@ class KummerLineIsogeny(KummerLineIsogeny_Generic):
     EllipticCurveHom_composite but using x-only formula
     """
 
-    def __init__(self, domain, kernel, degree, check=True, threshold=1500):
-        # Check the input to the isogeny is well-formed
-        self.validate_input(domain, kernel, degree, check=check)
+    @timed("isogeny_construction_seconds", "composite", per_degree=False)
+    def __init__(
+        self,
+        domain,
+        kernel,
+        degree,
+        check=True,
+        threshold=1500,
+        points=None,
+        cache=True,
+        factorization=None,
+    ):
+        # Check the input to the isogeny is well-formed, a pre-factored
+        # degree as a list of pairs (l, e) skips factoring the degree
+        self.validate_input(
+            domain, kernel, degree, check=check, factorization=factorization
+        )
+
+        # Look up the chain in the isogeny cache: cache=True uses the
+        # module cache when it is enabled, otherwise cache can be a
+        # KummerLineIsogenyCache or None
+        if cache is True:
+            cache = _isogeny_cache
+        elif cache is False:
+            cache = None
+
+        phis = None
+        if cache is not None:
+            key = cache.key(domain, kernel, degree, threshold)
+            phis = cache.get(key)
+
+        # One-shot mode: when the points to evaluate are known up front,
+        # push them through each step during construction and discard
+        # the steps. Only the codomain and the images are kept.
+        self._images = None
+        if points is not None and phis is not None:
+            self._images = tuple(
+                evaluate_factored_kummer_isogeny(phis, P) for P in points
+            )
+            self._phis = None
+            self._degree = Integer(degree)
+            self._domain = domain
+            self._codomain = phis[-1].codomain()
+            return
+
+        if points is not None:
+            self._codomain, images = factored_kummer_isogeny_images(
+                domain,
+                kernel,
+                degree,
+                points,
+                threshold=threshold,
+                factorization=factorization,
+            )
+            self._images = tuple(images)
+            self._phis = None
+            self._degree = Integer(degree)
+            self._domain = domain
+            return
 
         # Compute factored isogeny
-        self._phis = factored_kummer_isogeny(
-            domain, kernel, degree, threshold=threshold
-        )
+        if phis is None:
+            phis = factored_kummer_isogeny(
+                domain,
+                kernel,
+                degree,
+                threshold=threshold,
+                factorization=factorization,
+            )
+            if cache is not None:
+                cache.put(key, phis)
+
+        self._set_factors(phis)
+
+    def _set_factors(self, phis):
+        """
+        Set the steps of the chain, and compute the degree,
+        domain and codomain from them
 
+        Composite factors are flattened into their steps, and the
+        evaluation plan (f, data) of each step is collected so that
+        points are evaluated in one loop on raw (X : Z) coordinates
+        """
         # Make immutable
-        self._phis = tuple(self._phis)
+        self._phis = tuple(step for phi in phis for step in phi._factors())
+        self._plan = tuple(phi._evaluation_step() for phi in self._phis)
 
         # Compute degree, domain and codomain
-        self._degree = prod(phi.degree() for phi in self._phis)
+        self._degree = Integer(math.prod(phi.degree() for phi in self._phis))
         self._domain = self._phis[0].domain()
         self._codomain = self._phis[-1].codomain()
 
+    @timed("isogeny_evaluation_seconds", "composite", per_degree=False)
     def __call__(self, P):
         """
         Evaluate the composite isogeny by calling phi(P)
         """
-        return evaluate_factored_kummer_isogeny(self._phis, P)
+        if self._phis is None:
+            raise ValueError(
+                "isogeny was computed in one-shot mode, only the images of the "
+                "points supplied at construction are available"
+            )
+        if not isinstance(P, KummerPoint):
+            raise ValueError
+
+        # Evaluate the plan on the raw coordinates, and only
+        # construct the KummerPoint for the final image
+        X, Z = P.XZ()
+        registry = metrics()
+        if registry is None:
+            for f, data in self._plan:
+                X, Z = f(X, Z, data)
+        else:
+            for (f, data), phi in zip(self._plan, self._phis):
+                ((X, Z),) = _evaluate_plan_step(f, data, phi, [(X, Z)], registry)
+        return self._codomain((X, Z))
+
+    def _factors(self):
+        """
+        Return the prime degree steps of the chain as a tuple
+        """
+        if self._phis is None:
+            raise ValueError(
+                "isogeny was computed in one-shot mode, only the images of the "
+                "points supplied at construction are available"
+            )
+        return self._phis
+
+    def _evaluation_plan(self):
+        """
+        Return the evaluation plan of the chain
+        """
+        self._factors()
+        return self._plan
+
+    def _evaluate_xy(self, x, y):
+        """
+        Evaluate the composite isogeny on the affine point (x, y) by
+        evaluating the y-coordinate through each step
+        """
+        if self._phis is None:
+            raise ValueError(
+                "isogeny was computed in one-shot mode, only the images of the "
+                "points supplied at construction are available"
+            )
+        image = (x, y)
+        for phi in self._phis:
+            image = phi._evaluate_xy(*image)
+            if image is None:
+                return None
+        return image
+
+    def dual(self):
+        """
+        Compute the dual of the chain as the chain of the duals of each
+        step, in reverse order.
+
+        The dual of each step has kernel phi(T) for T a point of order ell
+        not in the kernel. As the chain does not backtrack, phi(T) is not
+        in the kernel of the next step of the same degree, so one point is
+        pushed through the steps for each prime and the dual costs about
+        one evaluation and one codomain computation per step. A new point
+        is only sampled at the start of the steps of each prime, which
+        assumes the group orders described in `_dual_kernel()`.
+
+        The codomain of each dual step is exactly the domain of the step,
+        so the codomain of the dual chain is the domain of the chain.
+        """
+        if self._phis is None:
+            raise ValueError(
+                "isogeny was computed in one-shot mode, only the images of the "
+                "points supplied at construction are available"
+            )
+
+        duals = []
+        T = None
+        for i, phi in enumerate(self._phis):
+            if i and phi.degree() != self._phis[i - 1].degree():
+                T = None
+            T = phi._dual_kernel(T)
+            duals.append(phi._dual_from_kernel(T))
+
+        return type(self).from_factors(reversed(duals))
+
+    def images(self):
+        """
+        Return the images of the points supplied with `points=...`
+        when the isogeny was constructed in one-shot mode
+        """
+        if self._images is None:
+            raise ValueError("no points were supplied when computing the isogeny")
+        return self._images
 
     @classmethod
     def from_factors(cls, maps):
@@ -838,13 +2348,65 @@ class KummerLineIsogeny(KummerLineIsogeny_Generic):
             L = phi.codomain()
 
         result = cls.__new__(cls)
+        result._images = None
+        result._set_factors(maps)
 
-        # Make immutable
-        result._phis = maps
+        return result
 
-        # Compute degree, domain and codomain
-        result._degree = prod(phi.degree() for phi in result._phis)
-        result._domain = result._phis[0].domain()
-        result._codomain = result._phis[-1].codomain()
 
-        return result
+# =============================================== #
+# Adapter to use Kummer Line isogenies on points  #
+# of Montgomery curves, with the interface of     #
+# SageMath EllipticCurveHom                       #
+# =============================================== #
+
+
+class KummerLineIsogenyHom:
+    """
+    Wraps a Kummer Line isogeny such that it acts on points of the
+    Montgomery curves `phi.domain().curve()` and `phi.codomain().curve()`
+    rather than Kummer Points, mimicking the interface of EllipticCurveHom.
+
+    The y-coordinates of images are computed along with the x-only formula,
+    so the whole evaluation is done with the Kummer Line isogenies
+    """
+
+    def __init__(self, phi):
+        if not isinstance(phi, KummerLineIsogeny_Generic):
+            raise TypeError(f"not an kummer-line isogeny: {phi}")
+        self._phi = phi
+
+    def __repr__(self):
+        return f"Isogeny of degree {self.degree().factor()} from {self.domain()} to {self.codomain()}"
+
+    def __call__(self, P):
+        """
+        Evaluate the isogeny on the point P of the domain curve
+        """
+        if P.curve() != self.domain():
+            raise ValueError(f"{P} is not a point on the domain {self.domain()}")
+        return self._phi.evaluate_curve_point(P)
+
+    def kummer_isogeny(self):
+        """
+        Return the underlying Kummer Line isogeny
+        """
+        return self._phi
+
+    def domain(self):
+        """
+        Return the domain of the isogeny as an EllipticCurve
+        """
+        return self._phi.domain().curve()
+
+    def codomain(self):
+        """
+        Return the codomain of the isogeny as an EllipticCurve
+        """
+        return self._phi.codomain().curve()
+
+    def degree(self):
+        """
+        Return the degree of the isogeny
+        """
+        return self._phi.degree()
@@ -51,19 +51,97 @@ where xPQ = x(P - Q).
 
 The 3 point ladder `xQ.ladder_3_pt(xP, xPQ, m) computes xP + [m]xQ
 
+KummerLine and KummerPoint are hashable, with the hash computed from the
+normalised values A/C and X/Z which are cached after the first call, and
+`batch_canonical_keys(objects)` computes them for many lines and points
+with a single inversion. The j-invariant can be computed projectively
+with `j_invariant_projective()` and `batch_j_invariants(lines)` computes
+many j-invariants with a single inversion.
+
+Points on the curve or its twist can be sampled deterministically with
+`K.sample_points(twist=...)` (using Elligator 2 when A != 0) and a basis
+of the N-torsion for N | p +/- 1 is computed by
+
+xP, xQ, xPQ = K.torsion_basis(N, twist=False)
+
+To validate untrusted points, K.is_on_curve(xP) and K.is_on_twist(xP)
+determine whether x^3 + Ax^2 + x is a square, and K.batch_is_on_curve(points)
+does this for many points at once.
+
+For full points, K.recover_y(P, xQ, xPQ) recovers Q from x(Q), x(P + Q) and
+P without a square root, and K.multiply_curve_point(P, m) uses this with the
+ladder `xP.ladder(m)`, which returns ([m]xP, [m+1]xP).
+
+All ell + 1 neighbours of K in the ell-isogeny graph are computed together
+from a basis of the ell-torsion with
+
+neighbours = K.neighbours(ell, K.torsion_basis(ell))
+
+xP.has_order(D) checks the point has exact order D, and xP.order(hint)
+computes the order given the factorisation of a multiple of it.
+
+xP.difference(xQ) computes x(P - Q) from x(P) and x(Q) using one square
+root, where the sign of Q is unknown so either x(P + Q) or x(P - Q) is
+returned.
+
 xP.multiples() generates values [l]xP by repeated differential addition. This
 is used for isogeny computations where we want to collect the the first d points
 for an isogeny of degree ell = 2d+1. 
 """
+import functools
+import math
+import numbers
+import sys
+
 import cypari2
 
+from kummer_metrics import metrics
+
 pari = cypari2.Pari()
 
-from sage.all import cached_method, Integer, EllipticCurve
+# SageMath is imported lazily. Only cypari2 is needed to import this
+# module, and `sage.all` is never imported: the Sage objects we need
+# (integers, elliptic curves) are imported from their own modules the
+# first time they are used.
+
+
+def cached_method(method):
+    """
+    Cache the result of a method without arguments on the instance,
+    a lightweight replacement for SageMath's `cached_method`
+    """
+    name = f"_cached_{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            value = self.__dict__[name] = method(self)
+            return value
+
+    return wrapper
+
+
+def Integer(n):
+    """
+    Convert n to a SageMath Integer, importing Sage on first use
+    """
+    from sage.rings.integer import Integer
+
+    return Integer(n)
+
+
+def _is_elliptic_curve_point(P):
+    """
+    Test whether P is a point on a SageMath elliptic curve, without
+    importing Sage when it has not already been loaded
+    """
+    ell_point = sys.modules.get("sage.schemes.elliptic_curves.ell_point")
+    if ell_point is None:
+        return False
+    return isinstance(P, ell_point.EllipticCurvePoint_field)
 
-from sage.structure.element import RingElement
-from sage.schemes.elliptic_curves.ell_generic import EllipticCurve_generic
-from sage.schemes.elliptic_curves.ell_point import EllipticCurvePoint_field
 
 # =================================================== #
 #     Class for the Kummer Line x(x^2 + Ax + 1)       #
@@ -77,6 +155,8 @@ class KummerLine:
         # Allow the creation of the Kummer Line from an EllipticCurve
         if len(args) == 1:
             (curve,) = args
+            from sage.schemes.elliptic_curves.ell_generic import EllipticCurve_generic
+
             if not isinstance(curve, EllipticCurve_generic):
                 raise TypeError("not an elliptic curve")
             ainvs = curve.a_invariants()
@@ -90,7 +170,7 @@ class KummerLine:
         elif len(args) == 2:
             base_ring, curve_constants = args
             # Extract curve constants
-            if isinstance(curve_constants, Integer) or len(curve_constants) == 1:
+            if isinstance(curve_constants, numbers.Integral) or len(curve_constants) == 1:
                 A = curve_constants
                 C = 1
             elif len(curve_constants) == 2:
@@ -107,6 +187,14 @@ class KummerLine:
                     a base field and tuple representing the coefficient A/C = [A, C]"
             )
 
+        # Cached canonical representatives, see `canonical_key()`
+        # and `j_invariant()`
+        self._key = None
+        self._j_invariant = None
+
+        # Cached twisted Edwards constants, see `edwards_constants()`
+        self._edwards = None
+
         # init variables
         self._A = self._base_ring(A)
         self._C = self._base_ring(C)
@@ -122,16 +210,24 @@ class KummerLine:
         """
         Test equality of two curves
         """
+        if not isinstance(other, KummerLine):
+            return NotImplemented
         if self.base_ring() != other.base_ring():
             return False
         return self._A * other._C == other._A * self._C
 
+    def __hash__(self):
+        """
+        Hash of the curve, invariant under scaling (A : C)
+        """
+        return hash((self._base_ring, self.canonical_key()))
+
     def __repr__(self):
         """
         String representation of the class
         """
         if self.a():
-            return f"Kummer line of the Montgomery curve y^2 = x^3 + {self.a()._coeff_repr()}*x^2 + x over {self.base_ring()}"
+            return f"Kummer line of the Montgomery curve y^2 = x^3 + {self._base_ring(self.a())._coeff_repr()}*x^2 + x over {self.base_ring()}"
         else:
             return f"Kummer line of the Montgomery curve y^2 = x^3 + x over {self.base_ring()}"
 
@@ -154,6 +250,42 @@ class KummerLine:
         """
         return self._A, self._C
 
+    def edwards_constants(self):
+        """
+        Return the constants of the twisted Edwards curve as a tuple
+        representing the projective form (Aed : Ded) = (A + 2C : A - 2C)
+        """
+        if self._edwards is None:
+            C2 = self._C + self._C
+            self._edwards = (self._A + C2, self._A - C2)
+        return self._edwards
+
+    @classmethod
+    def _from_edwards_constants(cls, base_ring, Aed, Ded):
+        """
+        Construct the Kummer Line from the pari constants (Aed : Ded) of
+        the twisted Edwards curve, with (A : C) = (2(Aed + Ded) : Aed - Ded)
+
+        The constants are not converted through the base ring and
+        (Aed : Ded) are cached, so an odd degree isogeny starting from
+        this line can use them without converting back. This is used
+        for the codomains of chains of odd degree isogenies.
+        """
+        if not Aed or not Ded:
+            raise ValueError(
+                f"Constants {(Aed, Ded)} do not define a twisted Edwards curve"
+            )
+        L = cls.__new__(cls)
+        L._curve = None
+        L._base_ring = base_ring
+        L._key = None
+        L._j_invariant = None
+        L._edwards = (Aed, Ded)
+        A = Aed + Ded
+        L._A = A + A
+        L._C = Aed - Ded
+        return L
+
     def zero(self):
         """
         Return the identity point on the Kummer Line
@@ -175,6 +307,8 @@ class KummerLine:
         Compute the Montgomery Curve associated with the
         Kummer Line
         """
+        from sage.schemes.elliptic_curves.constructor import EllipticCurve
+
         F = self.base_ring()
         a = self.a()
         return EllipticCurve(F, [0, a, 0, 1, 0])
@@ -185,6 +319,8 @@ class KummerLine:
         Compute the Isomorphic curve in the short Weierstrass model
         associated with the Kummer Line
         """
+        from sage.schemes.elliptic_curves.constructor import EllipticCurve
+
         F = self.base_ring()
         A = self.a()
 
@@ -194,14 +330,35 @@ class KummerLine:
         b = (2 * A_cube - 9 * A) / 27
         return EllipticCurve(F, [a, b])
 
-    @cached_method
+    def canonical_key(self):
+        """
+        Return the Montgomery coefficient A/C as an element of the base
+        field, this is the same for all projective representations
+        (A : C) and is computed once and cached
+        """
+        if self._key is None:
+            self._key = self._base_ring(self._A / self._C)
+        return self._key
+
+    def j_invariant_projective(self):
+        """
+        Compute the j-invariant of the Kummer Line as a projective
+        pair (j_num : j_den) without any inversions
+        """
+        A_sqr = self._A * self._A
+        C_sqr = self._C * self._C
+        j_num = 256 * (A_sqr - 3 * C_sqr) ** 3
+        j_den = C_sqr * C_sqr * (A_sqr - 4 * C_sqr)
+        return j_num, j_den
+
     def j_invariant(self):
         """
         Compute the j-invariant of the Kummer Line
         """
-        j_num = 256 * (self._A**2 - 3 * self._C**2) ** 3
-        j_den = self._C**4 * (self._A**2 - 4 * self._C**2)
-        return j_num / j_den
+        if self._j_invariant is None:
+            j_num, j_den = self.j_invariant_projective()
+            self._j_invariant = j_num / j_den
+        return self._j_invariant
 
     @cached_method
     def a(self):
@@ -211,6 +368,548 @@ class KummerLine:
         """
         return self._A / self._C
 
+    # =================================== #
+    #   Point sampling and torsion bases  #
+    # =================================== #
+
+    @cached_method
+    def non_square(self):
+        """
+        Deterministically find a non-square u in the base field,
+        the first of gen + n for n = 0, 1, 2, ...
+        """
+        F = self.base_ring()
+        g = F.gen()
+        n = 0
+        while True:
+            u = g + n
+            if not u.is_square():
+                return pari(u)
+            n += 1
+
+    def _rhs(self, X, Z):
+        """
+        Compute C*X*Z*(C*X^2 + A*X*Z + C*Z^2), which is a square exactly
+        when x = X/Z is the x-coordinate of a point on the curve
+        """
+        A, C = self.extract_constants()
+        XZ = X * Z
+        return C * XZ * (C * (X * X + Z * Z) + A * XZ)
+
+    def _quadratic_characters(self, values):
+        """
+        Compute the quadratic characters of a list of elements of the base
+        field. For GF(p^k), t is a square if and only if its norm to GF(p)
+        is a square, so we compute the norms and then the Legendre symbols
+        with Jacobi symbol (binary gcd-like) computations over the integers,
+        which is much cheaper than an exponentiation per element
+        """
+        F = self._base_ring
+        p = F.characteristic()
+        values = [F(t) for t in values]
+        if F.degree() > 1:
+            values = [t.norm() for t in values]
+        return [int(pari.kronecker(int(t), p)) for t in values]
+
+    def _is_square_rhs(self, X, Z):
+        """
+        Determine whether x = X/Z is the x-coordinate of a point on
+        the curve (True) or its quadratic twist (False)
+        """
+        (chi,) = self._quadratic_characters([self._rhs(X, Z)])
+        return chi != -1
+
+    def is_on_curve(self, xP):
+        """
+        Return True if xP is the x-coordinate of a point on the curve,
+        the identity and points of order two are on both the curve and
+        the twist
+        """
+        return self.batch_is_on_curve([xP])[0]
+
+    def is_on_twist(self, xP):
+        """
+        Return True if xP is the x-coordinate of a point on the quadratic
+        twist of the curve
+        """
+        return self.batch_is_on_curve([xP], twist=True)[0]
+
+    def batch_is_on_curve(self, points, twist=False):
+        """
+        Check whether each of the points is on the curve (or the twist
+        when twist=True), computing all quadratic characters together
+        without any inversions or exponentiations in the base field
+        """
+        values = []
+        for xP in points:
+            if not isinstance(xP, KummerPoint):
+                xP = self(xP)
+            if xP.parent() != self:
+                raise ValueError(f"{xP} is not a point on {self}")
+            values.append(self._rhs(*xP.XZ()))
+
+        bad = 1 if twist else -1
+        return [chi != bad for chi in self._quadratic_characters(values)]
+
+    def elligator(self, r):
+        """
+        Elligator 2 map: for a non-square u, the values
+
+            x1 = -A / (C(1 + u*r^2)),   x2 = u*r^2 * x1
+
+        are such that exactly one of them is the x-coordinate of a point
+        on the curve, and the other is on the quadratic twist.
+
+        Returns the pair (xP, xT) with xP on the curve and xT on the twist
+        """
+        A, C = self.extract_constants()
+        if not A:
+            raise ValueError("Elligator 2 requires A != 0")
+
+        u = self.non_square()
+        ur2 = u * r * r
+        Z = C * (1 + ur2)
+        if not Z:
+            raise ValueError(f"Elligator 2 is not defined for {r = }")
+
+        X1 = -A
+        X2 = X1 * ur2
+        if self._is_square_rhs(X1, Z):
+            return self((X1, Z)), self((X2, Z))
+        return self((X2, Z)), self((X1, Z))
+
+    def sample_points(self, twist=False):
+        """
+        Deterministically generate points on the curve, or the twist
+        when twist=True.
+
+        When A != 0 this uses Elligator 2 with r = 1, 2, ... and
+        otherwise we try x = u * r + 1 for the cached non-square u.
+        With x = u + r or x = u * r, whether x - i (resp. x) is a square
+        would be fixed, confining the points to half of E / [2]E, which
+        can prevent completing a basis of the 2^e-torsion.
+        """
+        A, _ = self.extract_constants()
+        u = self.non_square()
+        r = 0
+        while True:
+            r += 1
+            if A:
+                try:
+                    xP, xT = self.elligator(r)
+                except ValueError:
+                    continue
+                yield xT if twist else xP
+            else:
+                X = u * r + 1
+                if self._is_square_rhs(X, 1) != twist:
+                    yield self((X, 1))
+
+    @staticmethod
+    def _in_subgroup(T, B, ell):
+        """
+        Given points T and B of prime order ell, determine whether T
+        lies in the subgroup generated by B by checking whether x(T)
+        is a root of the kernel polynomial of <B>
+
+        Cost: O(ell) xADD
+        """
+        XT, ZT = T.XZ()
+        d = max(1, (ell - 1) // 2)
+        t = 1
+        for i, R in enumerate(B.multiples()):
+            if i >= d:
+                break
+            XR, ZR = R.XZ()
+            t *= XT * ZR - ZT * XR
+        return t == 0
+
+    @staticmethod
+    def _eigenvector_iota(B, ell):
+        """
+        Given B of prime order ell on the curve A = 0, determine whether
+        B is an eigenvector of the endomorphism iota : x -> -x.
+
+        iota has eigenvalues lambda with lambda^2 = -1 mod ell, so when
+        ell = 3 mod 4 there are no eigenvectors
+        """
+        if ell == 2:
+            return not B.XZ()[0]
+        if ell % 4 == 3:
+            return False
+
+        # Find a square root of -1 mod ell
+        g = 2
+        while True:
+            lam = pow(g, (ell - 1) // 4, ell)
+            if lam * lam % ell == ell - 1:
+                break
+            g += 1
+
+        X, Z = B.XZ()
+        XL, ZL = (lam * B).XZ()
+        return X * ZL == -XL * Z
+
+    def torsion_basis(self, N, twist=False, factorization=None):
+        """
+        Compute a basis (xP, xQ, xPQ) of the N-torsion on the curve,
+        or the quadratic twist when twist=True, where N divides p + 1
+        (resp. p - 1) and the base field is GF(p^2).
+
+        - Points are sampled with `sample_points()` and the cofactor is
+          cleared, the factorisation of N is used to check the order
+        - When A = 0, we take Q = iota(P) for the endomorphism
+          iota(x, y) = (-x, iy) which gives x(P - Q) = i(x^2 + 1)/2x
+          without a square root
+        - Otherwise, we sample Q independent of P and compute x(P - Q)
+          with one square root
+
+        When N is even, the basis is chosen such that (0,0) lies below
+        Q, to match `fix_even_torsion()`.
+        """
+        F = self.base_ring()
+        p = F.characteristic()
+        order = p - 1 if twist else p + 1
+        N = Integer(N)
+        if order % N:
+            raise ValueError(f"{N = } does not divide the order {order}")
+        cofactor = order // N
+
+        if factorization is None:
+            factorization = N.factor()
+        primes = [l for l, _ in factorization]
+
+        def bottom_points(T):
+            """
+            Returns the points [N/l]T for all l | N, or None if T
+            does not have order N
+            """
+            bottoms = []
+            for l in primes:
+                B = (N // l) * T
+                if B.is_zero():
+                    return None
+                bottoms.append(B)
+            return bottoms
+
+        points = (cofactor * T for T in self.sample_points(twist=twist))
+
+        xQ = None
+        A, C = self.extract_constants()
+        for xP in points:
+            BP = bottom_points(xP)
+            if BP is None:
+                continue
+
+            # For A = 0, use the endomorphism iota to compute Q
+            if not A:
+                if any(self._eigenvector_iota(B, l) for B, l in zip(BP, primes)):
+                    continue
+                X, Z = xP.XZ()
+                i = F(-1).sqrt()
+                i = pari(min(i, -i))
+                xQ = self((-X, Z))
+                xPQ = self((i * (X * X + Z * Z), 2 * X * Z))
+            break
+
+        # Otherwise, sample a second point and check it is independent
+        if xQ is None:
+            for xQ in points:
+                BQ = bottom_points(xQ)
+                if BQ is None:
+                    continue
+                if not any(
+                    self._in_subgroup(T, B, l) for T, B, l in zip(BQ, BP, primes)
+                ):
+                    break
+            xPQ = xP.difference(xQ)
+
+        # Ensure that (0,0) lies below Q
+        if N % 2 == 0:
+            P2 = (N // 2) * xP
+            Q2 = (N // 2) * xQ
+            if not P2.XZ()[0]:
+                xP, xQ = xQ, xP
+            elif Q2.XZ()[0]:
+                # x(P - (P + Q)) = x(Q), and for N = 2 we have P + Q = P - Q
+                # where the differential addition is not defined
+                xPQ_sum = xPQ if N == 2 else xP.add(xQ, xPQ)
+                xP, xQ, xPQ = xP, xPQ_sum, xQ
+
+        return xP, xQ, xPQ
+
+    # =================================== #
+    #        y-coordinate recovery        #
+    # =================================== #
+
+    def _recover_y_projective(self, xP, yP, XQ, ZQ, XS, ZS):
+        """
+        Okeya-Sakurai y-coordinate recovery, following Algorithm 5 of
+        https://ia.cr/2017/212 adapted to projective (A : C).
+
+        Input:  affine P = (xP, yP), x(Q) = (XQ : ZQ) and x(P + Q) = (XS : ZS)
+        Output: projective coordinates (X : Y : Z) of Q
+
+        Cost: 12M + 1S, no square roots or inversions
+        """
+        A, C = self.extract_constants()
+        A2 = A + A
+
+        v1 = xP * ZQ
+        v2 = C * (XQ + v1) + A2 * ZQ
+        v3 = XQ - v1
+        v3 = v3 * v3 * XS
+        v4 = xP * XQ + ZQ
+        v2 = v2 * v4 - A2 * ZQ * ZQ
+        Y = v2 * ZS - C * v3
+        v1 = 2 * C * yP * ZQ * ZS
+        X = v1 * XQ
+        Z = v1 * ZQ
+        return X, Y, Z
+
+    def recover_y(self, P, xQ, xPQ):
+        """
+        Given a point P on the Montgomery curve, together with the
+        Kummer points x(Q) and x(P + Q), recover the point Q on the
+        curve without computing a square root
+        """
+        E = self.curve()
+        if xQ.is_zero():
+            return E(0)
+        if xPQ.is_zero():
+            return -P
+
+        xP, yP = P.xy()
+        if not yP:
+            raise ValueError("P must not be a point of order two")
+
+        X, Y, Z = self._recover_y_projective(pari(xP), pari(yP), *xQ.XZ(), *xPQ.XZ())
+        F = self.base_ring()
+        return E([F(X), F(Y), F(Z)])
+
+    def multiply_curve_point(self, P, m):
+        """
+        Compute [m]P for a point P on the Montgomery curve using the
+        x-only Montgomery ladder followed by y-coordinate recovery
+        """
+        E = self.curve()
+        if P.is_zero():
+            return P
+        if m < 0:
+            return -self.multiply_curve_point(P, -m)
+
+        # Points of order two are their own inverses
+        if not P[1]:
+            return P if m % 2 else E(0)
+
+        xQ, xPQ = self((P[0], P[2])).ladder(m)
+        return self.recover_y(P, xQ, xPQ)
+
+    # =================================== #
+    #      Neighbours in isogeny graphs   #
+    # =================================== #
+
+    def neighbours(self, ell, basis, check=True):
+        """
+        Compute the codomains of the ell + 1 isogenies of prime degree
+        ell from this Kummer Line, given a basis (xP, xQ, xPQ) of the
+        ell-torsion with xPQ = x(P - Q)
+
+        The kernels are <Q> and <P + [i]Q> for 0 <= i < ell, and the
+        codomains are returned in this order. For odd ell, the multiples
+        [j](P + [i]Q) = [j]P + [ij]Q of all kernels are read from the grid
+        x([j]P + [k]Q) for 1 <= j <= (ell - 1)/2 and 0 <= k < ell, which is
+        computed with one differential addition per point and converted to
+        Edwards coordinates once. The codomains use the Meyer-Reith formula
+        and all of them are normalised to (a : 1) with a single inversion.
+
+        For ell = 2, one of the kernels is (0,0), whose codomain needs a
+        square root as in KummerLineIsogeny_Velu.
+
+        When check is True, the points must have order ell, xPQ must be
+        x(P + Q) or x(P - Q), and the Weil pairing w(P, Q) must be
+        non-trivial so that P and Q are independent.
+        """
+        ell = Integer(ell)
+        xP, xQ, xPQ = basis
+        for R in basis:
+            if not isinstance(R, KummerPoint) or R.parent() != self:
+                raise ValueError(f"{R} is not a point on {self}")
+        if check:
+            if not xP.has_order(ell) or not xQ.has_order(ell):
+                raise ValueError(f"The points do not have order {ell}")
+
+            # x(P - Q) is a root of the quadratic with roots x(P +/- Q),
+            # which has a = 0 exactly when x(P) = x(Q)
+            a, b, c = xP._difference_quadratic(xQ)
+            X, Z = xPQ.XZ()
+            if not a or (a * X + b * Z) * X + c * Z * Z:
+                raise ValueError(f"The points do not form a basis of E[{ell}]")
+
+            from kummer_pairing import weil_pairing
+
+            if weil_pairing(xP, xQ, xPQ, ell) == 1:
+                raise ValueError(f"The points do not form a basis of E[{ell}]")
+
+        if ell == 2:
+            edwards = self._neighbours_two(basis)
+        else:
+            edwards = self._neighbours_odd(ell, basis)
+
+        # Normalise all codomains to (a : 1) with one inversion, with
+        # (A : C) = (2(Aed + Ded) : Aed - Ded)
+        inverses = batch_inversion([Aed - Ded for Aed, Ded in edwards])
+        F = self.base_ring()
+        return [
+            KummerLine._from_edwards_constants(F, Aed * inv, Ded * inv)
+            for (Aed, Ded), inv in zip(edwards, inverses)
+        ]
+
+    def _neighbours_two(self, basis):
+        """
+        Renes codomains (in Edwards form) of the three 2-isogenies with
+        kernels Q, P and P + Q = P - Q, where the codomain for the
+        kernel (0,0) is computed as in KummerLineIsogeny_Velu
+        """
+        from kummer_isogeny import KummerLineIsogeny_Velu
+
+        xP, xQ, xPQ = basis
+        edwards = []
+        for xK in (xQ, xP, xPQ):
+            XK, ZK = xK.XZ()
+            if not XK:
+                phi = KummerLineIsogeny_Velu(self, xK, 2, check=False)
+                edwards.append(phi.codomain().edwards_constants())
+                continue
+
+            # (A : C) = (2(ZK^2 - 2XK^2) : ZK^2), and (Aed : Ded) = (A + 2C : A - 2C)
+            C = ZK * ZK
+            XK2 = XK * XK
+            XK2 = XK2 + XK2
+            A = C - XK2
+            A = A + A
+            C2 = C + C
+            edwards.append((A + C2, A - C2))
+        return edwards
+
+    def _neighbours_odd(self, ell, basis):
+        """
+        Meyer-Reith codomains (in Edwards form) of the ell + 1
+        isogenies of odd prime degree ell, see `neighbours()`
+        """
+        from kummer_isogeny import KummerLineIsogeny_Velu
+
+        xADD = KummerPoint.xADD
+        xP, xQ, xPQ = basis
+        d = (ell - 1) // 2
+        XP, ZP = xP.XZ()
+        XQ, ZQ = xQ.XZ()
+
+        # Multiples x([k]Q) for 1 <= k <= d, the kernel <Q>
+        row_Q = [xQ.XZ(), xQ.double().XZ()]
+        for _ in range(d - 2):
+            row_Q.append(xADD(*row_Q[-1], XQ, ZQ, *row_Q[-2]))
+        row_Q = row_Q[:d]
+
+        # Columns x([j]P) and x([j]P + Q) for 1 <= j <= d, from
+        # [j+1]P = [j]P + P and [j+1]P + Q = ([j]P + Q) + P
+        col_0 = [xP.XZ(), xP.double().XZ()]
+        col_1 = [xQ.XZ(), xP.add(xQ, xPQ).XZ()]
+        for _ in range(d - 1):
+            col_0.append(xADD(*col_0[-1], XP, ZP, *col_0[-2]))
+            col_1.append(xADD(*col_1[-1], XP, ZP, *col_1[-2]))
+
+        # The grid x([j]P + [k]Q) for 1 <= j <= d and 0 <= k < ell, in
+        # the Edwards coordinates (X - Z, X + Z)
+        grid = []
+        for j in range(d):
+            row = [col_0[j], col_1[j + 1]]
+            for _ in range(ell - 2):
+                row.append(xADD(*row[-1], XQ, ZQ, *row[-2]))
+            grid.append([(X - Z, X + Z) for X, Z in row])
+
+        # Products of the Edwards multiples of each kernel
+        products = []
+        prod_Y, prod_Z = 1, 1
+        for X, Z in row_Q:
+            prod_Y *= X - Z
+            prod_Z *= X + Z
+        products.append((prod_Y, prod_Z))
+        for i in range(ell):
+            prod_Y, prod_Z = 1, 1
+            for j in range(1, d + 1):
+                Y, W = grid[j - 1][(i * j) % ell]
+                prod_Y *= Y
+                prod_Z *= W
+            products.append((prod_Y, prod_Z))
+
+        Aed, Ded = self.edwards_constants()
+        return [
+            KummerLineIsogeny_Velu._edwards_codomain(Aed, Ded, prod_Y, prod_Z, ell)
+            for prod_Y, prod_Z in products
+        ]
+
+
+def batch_inversion(elements):
+    """
+    Invert a list of non-zero field elements with a single inversion
+    using Montgomery's trick
+
+    Cost: 1I + 3(n-1)M
+    """
+    elements = list(elements)
+    if not elements:
+        return []
+
+    # Prefix products: prods[i] = elements[0] * ... * elements[i]
+    prods = [elements[0]]
+    for x in elements[1:]:
+        prods.append(prods[-1] * x)
+
+    inv = 1 / prods[-1]
+    inverses = [None] * len(elements)
+    for i in range(len(elements) - 1, 0, -1):
+        inverses[i] = inv * prods[i - 1]
+        inv = inv * elements[i]
+    inverses[0] = inv
+    return inverses
+
+
+def batch_j_invariants(lines):
+    """
+    Compute the j-invariants of many Kummer Lines using a single
+    inversion. The results are cached on each line, so a later call
+    to `L.j_invariant()` costs nothing.
+    """
+    lines = list(lines)
+    todo = [L for L in lines if L._j_invariant is None]
+    pairs = [L.j_invariant_projective() for L in todo]
+    inverses = batch_inversion([j_den for _, j_den in pairs])
+    for L, (j_num, _), j_den_inv in zip(todo, pairs, inverses):
+        L._j_invariant = j_num * j_den_inv
+    return [L._j_invariant for L in lines]
+
+
+def batch_canonical_keys(objects):
+    """
+    Compute the canonical keys of many Kummer Lines and Kummer Points
+    using a single inversion. The keys are cached on each object, so
+    a later call to `canonical_key()` or `hash()` costs no inversion.
+    """
+    objects = list(objects)
+    todo = []
+    for obj in objects:
+        if obj._key is not None:
+            continue
+        if isinstance(obj, KummerLine):
+            todo.append((obj, obj._A, obj._C))
+        elif obj._Z:
+            todo.append((obj, obj._X, obj._Z))
+    inverses = batch_inversion([den for _, _, den in todo])
+    for (obj, num, _), den_inv in zip(todo, inverses):
+        obj._key = obj._base_ring(num * den_inv)
+    return [obj.canonical_key() for obj in objects]
+
 
 # ====================================================== #
 #  Class for points on the Kummer Line x(x^2 + Ax + 1)   #
@@ -227,19 +926,19 @@ class KummerPoint:
 
         # Point at infinity
         if coords is None:
-            coords = (Integer(1), Integer(0))
+            coords = (1, 0)
+        # Construct from a tuple (X : Z)
+        elif isinstance(coords, (tuple, list)):
+            coords = tuple(coords)
         # Construct point from P on an elliptic curve in Montgomery form
-        elif isinstance(coords, EllipticCurvePoint_field):
+        elif _is_elliptic_curve_point(coords):
             # Make sure point's parent curve matches with Kummer Line
             a = parent.a()
             assert coords.curve().a_invariants() == (0, a, 0, 1, 0)
-            coords = coords[0], coords[2]
+            coords = (coords[0], coords[2]) if coords else (1, 0)
         # Construct from X coordinate only
-        elif isinstance(coords, RingElement):
-            coords = (coords,)
-        # Construct from a tuple (X : Z)
         else:
-            coords = tuple(coords)
+            coords = (coords,)
 
         # Sanitise the input coordinates
         if len(coords) == 1:
@@ -248,15 +947,16 @@ class KummerPoint:
             raise ValueError("not a point on ℙ¹")
         coords = tuple(map(pari, map(R, coords)))
 
-        # TODO: we should make sure the coordinates
-        #       are on the curve!
-        # Write something like `parent.is_x_coord(X, Z)`
-        # which checks if x^3 + A*x^2 + x is a square in
-        # the base field...
+        # NOTE: the coordinates are not checked to be on the curve,
+        # as points on the twist are also valid. Use
+        # `parent.is_on_curve(xP)` or `parent.is_on_twist(xP)`
         self._base_ring = R
         self._parent = parent
         self._X, self._Z = coords
 
+        # Cached affine x-coordinate, see `canonical_key()`
+        self._key = None
+
     def __repr__(self):
         return f"Kummer Point [{self._X} : {self._Z}] on {self._parent}"
 
@@ -272,11 +972,28 @@ class KummerPoint:
         Equality of two Kummer Points
         """
         if not isinstance(other, KummerPoint):
-            raise ValueError("Can only compare equality between to Kummer Points")
+            return NotImplemented
         if self._parent != other._parent:
             return False
         return self._X * other._Z == other._X * self._Z
 
+    def __hash__(self):
+        """
+        Hash of the point, invariant under scaling (X : Z)
+        """
+        return hash((self._parent, self.canonical_key()))
+
+    def canonical_key(self):
+        """
+        Return the affine x-coordinate X/Z as an element of the base
+        field, or None for the identity. This is the same for all
+        projective representations (X : Z) and is computed once and
+        cached
+        """
+        if self._key is None and self._Z:
+            self._key = self.x()
+        return self._key
+
     def is_zero(self):
         """
         A Kummer Point is considered Zero if it is the identity point
@@ -508,6 +1225,153 @@ class KummerPoint:
 
         return self._add(Q, PQ)
 
+    # =================================== #
+    #         Order verification          #
+    # =================================== #
+
+    def _mul_prime_power(self, l, k):
+        """
+        Returns [l^k] self, using repeated doubling when l = 2
+        """
+        if l == 2:
+            return self.double_iter(k)
+        return l**k * self
+
+    def _has_order_descent(self, factors):
+        """
+        Recursive helper for `has_order()`. Given self with order dividing
+        the product of l^e for (l, e) in factors, check the order is exactly
+        this product.
+
+        The list of factors is split in two, and we clear the cofactor
+        of each half before recursing, in the style of a product tree.
+        """
+        if self.is_zero():
+            return False
+
+        if len(factors) == 1:
+            l, e = factors[0]
+            T = self._mul_prime_power(l, e - 1)
+            if T.is_zero():
+                return False
+            return (l * T).is_zero()
+
+        mid = len(factors) // 2
+        left, right = factors[:mid], factors[mid:]
+        m_left = math.prod(l**e for l, e in left)
+        m_right = math.prod(l**e for l, e in right)
+
+        # Abort early as soon as one half fails
+        if not (m_right * self)._has_order_descent(left):
+            return False
+        return (m_left * self)._has_order_descent(right)
+
+    def has_order(self, D, factorization=None):
+        """
+        Return True if the point has exact order D, where the
+        factorisation of D can be supplied to avoid computing it.
+
+        Rather than computing [D/l]P for each prime l | D, we use a
+        product tree descent which costs O(log(D) log(n)) for n distinct
+        primes, and aborts as soon as any check fails
+        """
+        D = Integer(D)
+        if D == 1:
+            return self.is_zero()
+        if factorization is None:
+            factorization = D.factor()
+        factors = [(Integer(l), e) for l, e in factorization]
+        return self._has_order_descent(factors)
+
+    def _order_descent(self, factors):
+        """
+        Recursive helper for `order()`, given self with order dividing
+        the product of l^e for (l, e) in factors, compute the order
+        """
+        if self.is_zero():
+            return Integer(1)
+
+        if len(factors) == 1:
+            l, e = factors[0]
+            T, k = self, 0
+            while not T.is_zero():
+                if k == e:
+                    raise ValueError(
+                        "The supplied factorisation is not a multiple of the order"
+                    )
+                T = T._mul_prime_power(l, 1)
+                k += 1
+            return l**k
+
+        mid = len(factors) // 2
+        left, right = factors[:mid], factors[mid:]
+        m_left = math.prod(l**e for l, e in left)
+        m_right = math.prod(l**e for l, e in right)
+
+        ord_left = (m_right * self)._order_descent(left)
+        ord_right = (m_left * self)._order_descent(right)
+        return ord_left * ord_right
+
+    def order(self, factored_hint):
+        """
+        Compute the exact order of the point given the factorisation
+        of a multiple of the order, for example p + 1, as a list of
+        pairs (l, e)
+        """
+        factors = [(Integer(l), e) for l, e in factored_hint]
+        return self._order_descent(factors)
+
+    def _difference_quadratic(self, Q):
+        """
+        Compute the coefficients (a, b, c) of the quadratic
+        a*x^2 + b*x + c whose roots are x(P + Q) and x(P - Q)
+        """
+        XP, ZP = self.XZ()
+        XQ, ZQ = Q.XZ()
+        A, C = self._parent.extract_constants()
+
+        XPXQ = XP * XQ
+        ZPZQ = ZP * ZQ
+        XPZQ = XP * ZQ
+        ZPXQ = ZP * XQ
+
+        a = XPZQ - ZPXQ
+        a = C * a * a
+        b = C * (XPXQ + ZPZQ) * (XPZQ + ZPXQ) + 2 * A * XPXQ * ZPZQ
+        b = -(b + b)
+        c = XPXQ - ZPZQ
+        c = C * c * c
+        return a, b, c
+
+    def difference(self, Q):
+        """
+        Given x(P) and x(Q), compute x(P - Q) using a single square root
+
+        The values x(P + Q) and x(P - Q) are the two roots of a quadratic
+        whose coefficients are functions of x(P) and x(Q), so we can only
+        recover x(P - Q) up to the sign of Q. Either root gives a valid
+        triple (xP, xQ, xPQ) for differential addition, and we take the
+        smaller square root so that the choice is deterministic.
+        """
+        if self._parent != Q._parent:
+            raise ValueError("Points must lie on the same Kummer Line")
+
+        a, b, c = self._difference_quadratic(Q)
+        if not a:
+            raise ValueError("x(P) and x(Q) must be distinct")
+
+        # Compute the square root in the base ring
+        disc = self._base_ring(b * b - 4 * a * c)
+        if not disc.is_square():
+            raise ValueError(
+                "P and Q must both lie on the curve, or both on the twist"
+            )
+        # PARI randomises which square root it returns
+        root = disc.sqrt()
+        root = pari(min(root, -root))
+
+        return self._parent((root - b, a + a))
+
     def __mul__(self, m):
         """
         Montgomery-ladder to compute [m]P
@@ -516,7 +1380,7 @@ class KummerPoint:
                scalar factor m, curve constants (A:C)
         Output: KummerPoint [m]P=(X0:Z0)
         """
-        if not isinstance(m, (int, Integer)):
+        if not isinstance(m, numbers.Integral):
             try:
                 m = Integer(m)
             except:
@@ -529,6 +1393,18 @@ class KummerPoint:
         # [m]P = [-m]P for x-only
         m = abs(m)
 
+        registry = metrics()
+        if registry is not None:
+            registry.increment("ladders_total")
+
+        X0, Z0, _, _ = self._ladder(m)
+        return self._parent((X0, Z0))
+
+    def _ladder(self, m):
+        """
+        Montgomery-ladder for m > 0 returning the coordinates
+        of both [m]P = (X0 : Z0) and [m+1]P = (X1 : Z1)
+        """
         # Extract base field and coefficients
         R = self.base_ring()
         XP, ZP = self.XZ()
@@ -550,7 +1426,20 @@ class KummerPoint:
             else:
                 X1, Z1, X0, Z0 = self.xDBLADD(X1, Z1, X0, Z0, XP, ZP, A24, C24)
 
-        return self._parent((X0, Z0))
+        return X0, Z0, X1, Z1
+
+    def ladder(self, m):
+        """
+        Montgomery-ladder returning the pair ([m]P, [m+1]P), which is
+        needed for y-coordinate recovery with `KummerLine.recover_y()`
+        """
+        m = Integer(m)
+        if m < 0:
+            raise ValueError("The scalar must be non-negative")
+        if not m:
+            return self._parent.zero(), self
+        X0, Z0, X1, Z1 = self._ladder(m)
+        return self._parent((X0, Z0)), self._parent((X1, Z1))
 
     def __rmul__(self, m):
         return self * m
@@ -566,7 +1455,7 @@ class KummerPoint:
 
         Note: self = xQ
         """
-        if not isinstance(m, (int, Integer)):
+        if not isinstance(m, numbers.Integral):
             try:
                 m = Integer(m)
             except:
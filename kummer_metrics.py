@@ -0,0 +1,290 @@
+"""
+Aggregated performance metrics for Kummer Line arithmetic and isogenies,
+with snapshots exported as JSON or in the Prometheus text format
+
+===========================================================================
+
+USAGE:
+
+registry = enable_metrics(max_samples=1024)
+
+phi = KummerLineIsogeny(L, xK, degree)
+imxP = phi(xP)
+
+registry.write_snapshot("metrics.json")
+registry.write_snapshot("metrics.prom", format="prometheus")
+disable_metrics()
+
+When metrics are disabled (the default) the instrumented functions only
+check a module variable, so the cost is negligible.
+
+The metrics recorded are:
+
+- kummer_isogeny_construction_seconds, labelled by algorithm ("velu",
+  "velu_extension", "velusqrt" or "composite") and by ell for prime degree
+  steps: the count is the number of isogenies computed
+- kummer_isogeny_evaluation_seconds, with the same labels, for every call
+  phi(xP) and VéluSqrt `evaluate_many()`. The steps of a chain, which are
+  evaluated through its flattened plan by phi(xP) and `evaluate_stream()`,
+  are recorded for each point and step as if the step had been called
+- kummer_ladders_total, the number of scalar multiplications xP * m
+- kummer_isogeny_cache_hits_total and kummer_isogeny_cache_misses_total
+  for the isogeny cache
+
+===========================================================================
+
+INFO:
+
+Timings keep the count, sum and maximum of all observations, and the
+percentiles (50%, 90% and 99%) are computed from a window of the most
+recent `max_samples` observations, so the memory used by the registry is
+bounded however long the process runs. Updates are guarded by a lock so
+the registry can be shared between threads.
+
+Snapshots are written to a temporary file which is then renamed, so a
+collector reading the file never sees a partial snapshot.
+"""
+
+# Python imports
+from collections import deque
+import functools
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+
+PREFIX = "kummer_"
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class _Timing:
+    """
+    Count, sum and maximum of the observations of one timing, with a
+    window of recent observations for the percentiles
+    """
+
+    def __init__(self, max_samples):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.samples = deque(maxlen=max_samples)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        self.samples.append(seconds)
+
+    def quantiles(self):
+        """
+        Nearest rank percentiles of the recent observations
+        """
+        samples = sorted(self.samples)
+        if not samples:
+            return {q: 0.0 for q in QUANTILES}
+        n = len(samples)
+        return {q: samples[max(0, math.ceil(q * n) - 1)] for q in QUANTILES}
+
+
+class MetricsRegistry:
+    """
+    Registry of counters and timings, each identified by a name and a
+    set of labels
+    """
+
+    def __init__(self, max_samples=1024):
+        if max_samples < 1:
+            raise ValueError("max_samples must be positive")
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._timings = {}
+
+    def __repr__(self):
+        return f"Metrics registry with {len(self._counters)} counters and {len(self._timings)} timings"
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def increment(self, name, amount=1, **labels):
+        """
+        Add amount to the counter name
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        """
+        Record a duration in seconds for the timing name
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = _Timing(self._max_samples)
+            timing.observe(seconds)
+
+    def reset(self):
+        """
+        Remove all counters and timings
+        """
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+    # =================================== #
+    #          Snapshots and export       #
+    # =================================== #
+
+    def snapshot(self):
+        """
+        Return the current values of all metrics as a dictionary
+        """
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            timings = []
+            for (name, labels), timing in sorted(self._timings.items()):
+                timings.append(
+                    {
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": timing.count,
+                        "sum": timing.total,
+                        "max": timing.maximum,
+                        "quantiles": {
+                            str(q): v for q, v in timing.quantiles().items()
+                        },
+                    }
+                )
+        return {"timestamp": time.time(), "counters": counters, "timings": timings}
+
+    def to_json(self):
+        """
+        Return a snapshot encoded as JSON
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """
+        Return a snapshot in the Prometheus text exposition format, with
+        counters as counter and timings as summary metrics
+        """
+
+        def labels_str(labels, **extra):
+            labels = {**labels, **extra}
+            if not labels:
+                return ""
+            inner = ",".join(f'{k}="{v}"' for k, v in labels.items())
+            return "{" + inner + "}"
+
+        snapshot = self.snapshot()
+        lines = []
+
+        seen = set()
+        for counter in snapshot["counters"]:
+            name = PREFIX + counter["name"]
+            if name not in seen:
+                lines.append(f"# TYPE {name} counter")
+                seen.add(name)
+            lines.append(f"{name}{labels_str(counter['labels'])} {counter['value']}")
+
+        for timing in snapshot["timings"]:
+            name = PREFIX + timing["name"]
+            labels = timing["labels"]
+            if name not in seen:
+                lines.append(f"# TYPE {name} summary")
+                seen.add(name)
+            for q, v in timing["quantiles"].items():
+                lines.append(f"{name}{labels_str(labels, quantile=q)} {v}")
+            lines.append(f"{name}_sum{labels_str(labels)} {timing['sum']}")
+            lines.append(f"{name}_count{labels_str(labels)} {timing['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_snapshot(self, path, format="json"):
+        """
+        Write a snapshot to the file at path, as "json" or "prometheus"
+        """
+        if format == "json":
+            data = self.to_json()
+        elif format == "prometheus":
+            data = self.to_prometheus()
+        else:
+            raise ValueError(f"unknown snapshot format: {format}")
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+# =================================================== #
+#   Module registry used by the instrumented code     #
+# =================================================== #
+
+_registry = None
+
+
+def enable_metrics(max_samples=1024):
+    """
+    Enable metrics, replacing the registry by an empty one, and
+    return the registry
+    """
+    global _registry
+    _registry = MetricsRegistry(max_samples=max_samples)
+    return _registry
+
+
+def disable_metrics():
+    """
+    Disable metrics, the registry is discarded
+    """
+    global _registry
+    _registry = None
+
+
+def metrics():
+    """
+    Return the metrics registry, or None when metrics are disabled
+    """
+    return _registry
+
+
+def timed(name, algorithm, per_degree=True):
+    """
+    Decorator for methods of isogeny classes, recording the duration of
+    each call as the timing name, labelled by the algorithm and, when
+    per_degree is True, by the degree of the isogeny
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            registry = _registry
+            if registry is None:
+                return method(self, *args, **kwargs)
+
+            start = time.perf_counter()
+            result = method(self, *args, **kwargs)
+            elapsed = time.perf_counter() - start
+            if per_degree:
+                registry.observe(name, elapsed, algorithm=algorithm, ell=self._degree)
+            else:
+                registry.observe(name, elapsed, algorithm=algorithm)
+            return result
+
+        return wrapper
+
+    return decorator
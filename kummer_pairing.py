@@ -0,0 +1,325 @@
+"""
+x-only Tate and Weil pairings on Kummer Lines using cubical arithmetic
+
+===========================================================================
+
+USAGE:
+
+e = tate_pairing(xP, xQ, xPQ, N)
+w = weil_pairing(xP, xQ, xPQ, N)
+
+Where xP and xQ are points of order dividing N on the same Kummer Line and
+xPQ = x(P - Q). Pairings sharing the first point are computed together with
+
+es = batch_tate_pairing(xP, [(xQ1, xPQ1), (xQ2, xPQ2), ...], N)
+
+As points on a Kummer Line are only defined up to sign, swapping xPQ for
+x(P + Q) replaces the pairing by its inverse.
+
+The non-reduced Tate pairing (reduced=False) is only available for odd N,
+and the reduced pairing needs 2N to divide q - 1 for the base field GF(q),
+which holds for all N dividing p + 1 over GF(p^2).
+
+Pairings with the identity are 1 and w_N(P, P) = 1, so these inputs are
+always accepted. The cubical arithmetic divides by the x-coordinates of P,
+Q and P - Q, so for the Weil pairing the cases where one of them is the
+2-torsion point T = (0, 0) are computed from w_N(P, T) = w_2([N/2]P, T),
+which is -1 when [N/2]P is a 2-torsion point other than T and 1 otherwise.
+The Tate pairing does not support these inputs.
+
+===========================================================================
+
+INFO:
+
+Fast pairings via biextensions and cubical arithmetic: https://ia.cr/2024/517
+Damien Robert
+
+Cubical arithmetic works with fixed representatives (X, Z) of points on
+the Kummer Line rather than projective classes. With a24 = (A + 2C)/4C,
+the cubical doubling and differential addition are
+
+    [2](X : Z) = ((X + Z)^2 (X - Z)^2, 4XZ((X - Z)^2 + a24 * 4XZ))
+    P + Q = ((U + V)^2 / 4x(P - Q), (U - V)^2 / 4)
+
+with U = (XP - ZP)(XQ + ZQ) and V = (XP + ZP)(XQ - ZQ), these are the
+xDBL and xADD formula with the projective factors fixed. Starting from
+the affine representatives P = (xP, 1), Q = (xQ, 1) and P - Q = (xPQ, 1),
+the three point ladder gives
+
+    [N]P = (lambda_P, 0),   [N]P + Q = lambda_PQ * (xQ, 1)
+
+The Kummer Line only sees the divisor 2(O) rather than (O), so the quotient
+lambda_PQ / lambda_P is the square t(P, Q)^2 of the non-reduced Tate
+pairing. The reduced Tate pairing is therefore computed by raising it to
+the power (q - 1)/2N for the base field GF(q), and the quotient of the
+squares t(P, Q)^2 / t(Q, P)^2 is the square of the Weil pairing.
+
+When N is odd, squaring is a bijection of the N-th roots of unity, and
+the pairings are recovered by raising the squares to the power (N + 1)/2.
+When N is even, the sign of the Weil pairing is not determined by the
+x-coordinates, so P is lifted to the curve with one square root, Q is
+recovered from x(P - Q) with `recover_y()`, and the pairing is computed
+by SageMath (using PARI) on the curve.
+
+The coordinates are normalised with a single batch inversion, which also
+gives the inverses 1/4x needed for the cubical additions, and the ladder
+for [N]P is shared between all pairings with the same first point.
+"""
+
+# Local imports
+from kummer_line import KummerPoint, Integer, batch_inversion, pari
+
+
+def _cubical_DBLADD(X0, Z0, X1, Z1, inv_4x, a24, inv_4):
+    """
+    Cubical doubling of R0 = (X0, Z0) and differential addition R0 + R1
+    where the difference R1 - R0 has affine x-coordinate x with
+    inv_4x = 1/4x
+    """
+    t0 = X0 + Z0
+    t1 = X0 - Z0
+    t2 = X1 + Z1
+    t3 = X1 - Z1
+
+    # Differential addition
+    U = t1 * t2
+    V = t0 * t3
+    X_add = U + V
+    Z_add = U - V
+    X_add = X_add * X_add * inv_4x
+    Z_add = Z_add * Z_add * inv_4
+
+    # Doubling
+    t0 *= t0
+    t1 *= t1
+    t2 = t0 - t1
+    X_dbl = t0 * t1
+    Z_dbl = t2 * (t1 + a24 * t2)
+
+    return X_dbl, Z_dbl, X_add, Z_add
+
+
+def _cubical_ADD(XP, ZP, XQ, ZQ, inv_4x, inv_4):
+    """
+    Cubical differential addition P + Q where P - Q has affine
+    x-coordinate x with inv_4x = 1/4x
+    """
+    U = (XP - ZP) * (XQ + ZQ)
+    V = (XP + ZP) * (XQ - ZQ)
+    X_add = U + V
+    Z_add = U - V
+    return X_add * X_add * inv_4x, Z_add * Z_add * inv_4
+
+
+def _check_points(L, points):
+    """
+    Ensure all points are KummerPoints on L
+    """
+    for R in points:
+        if not isinstance(R, KummerPoint) or R.parent() != L:
+            raise ValueError(f"{R} is not a point on {L}")
+
+
+def _normalise(xP, others):
+    """
+    Given xP and a list of pairs (xQ, xPQ), compute the affine
+    x-coordinates, the inverses 1/4x of each, and a24 = (A + 2C)/4C
+    with a single inversion
+    """
+    L = xP.parent()
+    points = [xP] + [R for pair in others for R in pair]
+    _check_points(L, points)
+
+    XZ = [R.XZ() for R in points]
+    if any(not X or not Z for X, Z in XZ):
+        raise ValueError(
+            "Cubical arithmetic needs P, Q and P - Q to be neither the "
+            "identity nor (0, 0)"
+        )
+
+    # The inverse of 4C gives both 1/4 and a24
+    A, C = L.extract_constants()
+    C4 = C + C
+    C4 = C4 + C4
+    n = len(XZ)
+    inverses = batch_inversion([C4] + [X for X, _ in XZ] + [Z for _, Z in XZ])
+    inv_C4, inv_X, inv_Z = inverses[0], inverses[1 : n + 1], inverses[n + 1 :]
+    inv_4 = C * inv_C4
+
+    # x = X/Z and 1/4x = Z/4X
+    xs = [X * iZ for (X, _), iZ in zip(XZ, inv_Z)]
+    inv_4xs = [Z * iX * inv_4 for (_, Z), iX in zip(XZ, inv_X)]
+    a24 = (A + C + C) * inv_C4
+    return xs, inv_4xs, a24, inv_4
+
+
+def _squared_tate(xP, others, N):
+    """
+    Compute the squares of the non-reduced Tate pairings, which are
+    lambda_PQ / lambda_P, for all pairs (xQ, xPQ) in others, sharing
+    the cubical ladder for [N]P
+    """
+    N = Integer(N)
+    if N <= 0:
+        raise ValueError("The order N must be positive")
+
+    xs, inv_4xs, a24, inv_4 = _normalise(xP, others)
+    x_P, inv_4x_P = xs[0], inv_4xs[0]
+
+    F = xP.parent().base_ring()
+    one, zero = pari(F.one()), pari(F.zero())
+
+    # R0 = [n]P, R1 = [n+1]P and R2[i] = [n]P + Q_i
+    X0, Z0 = one, zero
+    X1, Z1 = x_P, one
+    R2 = [(xs[i], one) for i in range(1, len(xs), 2)]
+    diffs = [(inv_4xs[i], inv_4xs[i + 1]) for i in range(1, len(xs), 2)]
+
+    for bit in bin(N)[2:]:
+        if bit == "0":
+            # [2n]P + Q = R0 + R2 with difference Q
+            R2 = [
+                _cubical_ADD(X0, Z0, X2, Z2, inv_4x_Q, inv_4)
+                for (X2, Z2), (inv_4x_Q, _) in zip(R2, diffs)
+            ]
+            X0, Z0, X1, Z1 = _cubical_DBLADD(X0, Z0, X1, Z1, inv_4x_P, a24, inv_4)
+        else:
+            # [2n + 1]P + Q = R1 + R2 with difference P - Q
+            R2 = [
+                _cubical_ADD(X1, Z1, X2, Z2, inv_4x_PQ, inv_4)
+                for (X2, Z2), (_, inv_4x_PQ) in zip(R2, diffs)
+            ]
+            X1, Z1, X0, Z0 = _cubical_DBLADD(X1, Z1, X0, Z0, inv_4x_P, a24, inv_4)
+
+    if Z0:
+        raise ValueError(f"The order of xP does not divide {N}")
+
+    # [N]P = (lambda_P, 0) and [N]P + Q = lambda_PQ * (xQ, 1)
+    inv_lambda_P = 1 / X0
+    return [Z2 * inv_lambda_P for _, Z2 in R2]
+
+
+def _final_exponentiation(xP, values, N):
+    """
+    Raise the squared non-reduced pairings to the power (q - 1)/2N for
+    the base field GF(q), which gives the reduced pairings
+    """
+    F = xP.parent().base_ring()
+    q = F.order()
+    if (q - 1) % (2 * N):
+        raise ValueError(f"2N = {2 * N} must divide q - 1 = {q - 1}")
+    e = (q - 1) // (2 * N)
+    return [F(t**e) for t in values]
+
+
+def _square_root_of_unity(t, N):
+    """
+    Given t = w^2 for an N-th root of unity w and N odd, return
+    w = t^((N + 1)/2)
+    """
+    if N % 2 == 0:
+        raise ValueError(
+            f"The square of the pairing does not determine it for even {N = }"
+        )
+    return t ** ((N + 1) // 2)
+
+
+def _weil_pairing_two_torsion(xP, N):
+    """
+    Compute w_N(P, T) for T = (0, 0) as w_2([N/2]P, T)
+    """
+    N = Integer(N)
+    if N % 2:
+        raise ValueError(f"(0, 0) has order 2, which does not divide {N = }")
+    xM = (N // 2) * xP
+    if not xM.double().is_zero():
+        raise ValueError(f"The order of xP does not divide {N}")
+
+    F = xP.parent().base_ring()
+    if xM.is_zero() or not xM.XZ()[0]:
+        return F.one()
+    return -F.one()
+
+
+def batch_tate_pairing(xP, pairs, N, reduced=True):
+    """
+    Compute the Tate pairings e_N(P, Q_i) for all pairs (xQ_i, xPQ_i)
+    with xPQ_i = x(P - Q_i), sharing the ladder for [N]P
+    """
+    pairs = [tuple(pair) for pair in pairs]
+    F = xP.parent().base_ring()
+    _check_points(xP.parent(), [xP] + [R for pair in pairs for R in pair])
+
+    # Pairings with the identity are 1, and the ladder is only
+    # computed for the remaining pairs
+    if xP.is_zero():
+        return [F.one()] * len(pairs)
+    indices = [i for i, (xQ, _) in enumerate(pairs) if not xQ.is_zero()]
+    values = _squared_tate(xP, [pairs[i] for i in indices], N)
+    if reduced:
+        values = _final_exponentiation(xP, values, N)
+    else:
+        values = [_square_root_of_unity(t, N) for t in values]
+
+    result = [F.one()] * len(pairs)
+    for i, t in zip(indices, values):
+        result[i] = F(t)
+    return result
+
+
+def tate_pairing(xP, xQ, xPQ, N, reduced=True):
+    """
+    Compute the Tate pairing e_N(P, Q) from x(P), x(Q) and x(P - Q),
+    when reduced is False the non-reduced pairing is returned, which
+    needs N to be odd
+    """
+    (e,) = batch_tate_pairing(xP, [(xQ, xPQ)], N, reduced=reduced)
+    return e
+
+
+def _weil_pairing_lifted(xP, xQ, xPQ, N):
+    """
+    Compute w_N(P, Q) by lifting P to the curve with one square root
+    and recovering Q from x(P - Q), used when N is even
+    """
+    L = xP.parent()
+    P = xP.curve_point()
+    if P[1]:
+        # x(-P + Q) = x(P - Q)
+        Q = L.recover_y(-P, xQ, xPQ)
+    else:
+        # For P of order two, w(P, -Q) = w(P, Q)^-1 = w(P, Q)
+        Q = xQ.curve_point()
+    return P.weil_pairing(Q, N)
+
+
+def weil_pairing(xP, xQ, xPQ, N):
+    """
+    Compute the Weil pairing w_N(P, Q) from x(P), x(Q) and x(P - Q). For
+    odd N, this is computed from the quotient of the squared non-reduced
+    Tate pairings t(P, Q)^2 / t(Q, P)^2, and for even N the points are
+    lifted to the curve
+    """
+    L = xP.parent()
+    _check_points(L, [xP, xQ, xPQ])
+    F = L.base_ring()
+
+    # w(O, Q) = w(P, O) = w(P, P) = 1
+    if xP.is_zero() or xQ.is_zero() or xPQ.is_zero():
+        return F.one()
+
+    # When one of P, Q or P - Q is T = (0, 0), the pairing is w(R, T)
+    # for another of the points R, as w(P, P + T) = w(P, T) and the
+    # values are +/-1 so w(T, Q) = w(Q, T)
+    if not xP.XZ()[0]:
+        return _weil_pairing_two_torsion(xQ, N)
+    if not xQ.XZ()[0] or not xPQ.XZ()[0]:
+        return _weil_pairing_two_torsion(xP, N)
+
+    N = Integer(N)
+    if N % 2 == 0:
+        return _weil_pairing_lifted(xP, xQ, xPQ, N)
+
+    (t_PQ,) = _squared_tate(xP, [(xQ, xPQ)], N)
+    (t_QP,) = _squared_tate(xQ, [(xP, xPQ)], N)
+    return F(_square_root_of_unity(t_PQ / t_QP, N))
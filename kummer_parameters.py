@@ -0,0 +1,275 @@
+"""
+Registry of known parameter sets for isogeny based protocols, with the
+factorisations of the torsion stored so nothing is factored at runtime
+
+===========================================================================
+
+USAGE:
+
+params = get_parameters("BSIDH-3")
+L = params.kummer_line()
+xP, xQ, xPQ = params.torsion_basis("A")
+
+phi = KummerLineIsogeny(
+    L, xK, params.order("A"), factorization=params.factorization("A")
+)
+
+The known parameter sets are listed by `list_parameters()`:
+
+- FESTA-128, from benchmark.py, with the torsion d1, d2 and the 2-power
+- SQISign-p3923 and SQISign-p6983, from example_SQISign.sage
+- BSIDH-2 and BSIDH-3, examples two and three of https://ia.cr/2019/1145
+
+===========================================================================
+
+INFO:
+
+Only the prime p, the Montgomery coefficient of the starting curve over
+GF(p^2) = GF(p)[i] / (i^2 + 1) and, for each named torsion subgroup, the
+factorisation of its order N and whether N divides p + 1 or p - 1 are
+stored, as plain integers.
+
+The parameter set is constructed the first time `get_parameters()` asks
+for it, and its field, Kummer Line and torsion bases are computed the
+first time they are requested and then cached.
+"""
+
+# Python imports
+import math
+
+# Local imports
+from kummer_line import KummerLine, Integer
+
+
+class KummerParameters:
+    """
+    A parameter set: the prime p, the starting Montgomery curve over
+    GF(p^2) and factorisations of named torsion subgroups
+    """
+
+    def __init__(self, name, p, A, torsion):
+        self._name = name
+        self._p = Integer(p)
+        self._A = A
+
+        # Dictionary name -> (factorisation, twist)
+        self._torsion = {}
+        for label, (factorization, twist) in torsion.items():
+            factorization = tuple((Integer(l), e) for l, e in factorization)
+            N = math.prod(l**e for l, e in factorization)
+            order = self._p - 1 if twist else self._p + 1
+            if order % N:
+                raise ValueError(f"The torsion {label} does not divide {order}")
+            self._torsion[label] = (factorization, twist)
+
+        # Computed on first use
+        self._field = None
+        self._kummer_line = None
+        self._bases = {}
+
+    def __repr__(self):
+        return f"Parameter set {self._name} with p = {self._p}"
+
+    def name(self):
+        """
+        Return the name of the parameter set
+        """
+        return self._name
+
+    def p(self):
+        """
+        Return the characteristic p
+        """
+        return self._p
+
+    def torsion_labels(self):
+        """
+        Return the names of the torsion subgroups
+        """
+        return tuple(self._torsion)
+
+    def _torsion_data(self, label):
+        try:
+            return self._torsion[label]
+        except KeyError:
+            raise ValueError(f"unknown torsion {label} for {self._name}")
+
+    def factorization(self, label):
+        """
+        Return the factorisation of the order of the torsion as a
+        tuple of pairs (l, e)
+        """
+        factorization, _ = self._torsion_data(label)
+        return factorization
+
+    def order(self, label):
+        """
+        Return the order N of the torsion
+        """
+        return Integer(math.prod(l**e for l, e in self.factorization(label)))
+
+    def is_twist(self, label):
+        """
+        Return True when the torsion lies on the quadratic twist,
+        so that N divides p - 1
+        """
+        _, twist = self._torsion_data(label)
+        return twist
+
+    def cofactor(self, label):
+        """
+        Return the cofactor (p +/- 1) / N of the torsion
+        """
+        N = self.p() - 1 if self.is_twist(label) else self.p() + 1
+        return N // self.order(label)
+
+    def field(self):
+        """
+        Return the field GF(p^2) with modulus x^2 + 1
+        """
+        if self._field is None:
+            from sage.rings.finite_rings.finite_field_constructor import GF
+
+            self._field = GF(self._p**2, name="i", modulus=[1, 0, 1])
+        return self._field
+
+    def kummer_line(self):
+        """
+        Return the Kummer Line of the starting curve
+        """
+        if self._kummer_line is None:
+            self._kummer_line = KummerLine(self.field(), [self._A, 1])
+        return self._kummer_line
+
+    def torsion_basis(self, label):
+        """
+        Return a basis (xP, xQ, xPQ) of the torsion on the starting
+        curve, where for even N the point (0,0) lies below Q. The basis
+        is computed deterministically once and then cached.
+        """
+        if label not in self._bases:
+            factorization, twist = self._torsion_data(label)
+            self._bases[label] = self.kummer_line().torsion_basis(
+                self.order(label), twist=twist, factorization=factorization
+            )
+        return self._bases[label]
+
+
+# =================================================== #
+#             Known parameter sets                    #
+# =================================================== #
+
+# Dictionary name -> (p, A, {label: (factorisation, twist)}), kept as
+# plain ints until the parameter set is first requested
+# fmt: off
+_PARAMETERS = {
+    "FESTA-128": (
+        0x176C11CF13E54B11406FCEC87BD4C1480F2BF6B3CF47C54370FEBD1C756E54F72C1501712922BAF5993402979D50DD13D09A841FED4773CFDB168F19A73E323F656921D7DCD797059B7B9AC3245C4D7BE6B343FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF,
+        6,
+        {
+            "d1": (
+                [(3, 6), (19, 2), (29, 2), (37, 2), (83, 2), (139, 2), (167, 2), (251, 2), (419, 2), (421, 2),
+                 (701, 2), (839, 2), (1009, 2), (1259, 2), (3061, 2), (3779, 2)],
+                False,
+            ),
+            "d2": (
+                [(5, 4), (7, 3), (11, 2), (13, 2), (17, 2), (41, 2), (43, 2), (71, 2), (89, 2), (127, 2),
+                 (211, 2), (281, 2), (503, 2), (631, 2), (2309, 2), (2521, 2), (2647, 2), (2729, 2)],
+                False,
+            ),
+            "dA1_sqrt": ([(59, 1), (6299, 1), (6719, 1), (9181, 1)], False),
+            "dA2_sqrt": ([(3023, 1), (3359, 1), (4409, 1), (5039, 1), (19531, 1), (22679, 1), (41161, 1)], False),
+            "two": ([(2, 634)], False),
+        },
+    ),
+    "SQISign-p3923": (
+        23759399264157352358673788613307970528646815114090876784643387662192449945599,
+        0,
+        {
+            "A": (
+                [(2, 65), (5, 2), (7, 1), (11, 1), (19, 1), (29, 2), (37, 2), (47, 1), (197, 1), (263, 1),
+                 (281, 1), (461, 1), (521, 1), (3923, 1)],
+                False,
+            ),
+            "B": (
+                [(2, 1), (3, 65), (13, 1), (17, 1), (43, 1), (79, 1), (157, 1), (239, 1), (271, 1), (283, 1),
+                 (307, 1), (563, 1), (599, 1), (607, 1), (619, 1), (743, 1), (827, 1), (941, 1), (2357, 1)],
+                True,
+            ),
+        },
+    ),
+    "SQISign-p6983": (
+        73743043621499797449074820543863456997944695372324032511999999999999999999999,
+        0,
+        {
+            "A": (
+                [(2, 33), (5, 21), (7, 2), (11, 1), (31, 1), (83, 1), (107, 1), (137, 1), (751, 1), (827, 1),
+                 (3691, 1), (4019, 1), (6983, 1)],
+                False,
+            ),
+            "B": (
+                [(2, 1), (3, 53), (43, 1), (103, 2), (109, 1), (199, 1), (227, 1), (419, 1), (491, 1), (569, 1),
+                 (631, 1), (677, 1), (857, 1), (859, 1), (883, 1), (1019, 1), (1171, 1), (1879, 1), (2713, 1),
+                 (4283, 1)],
+                True,
+            ),
+        },
+    ),
+    "BSIDH-2": (
+        0x1935BECE108DC6C0AAD0712181BB1A414E6A8AAA6B510FC29826190FE7EDA80F,
+        0,
+        {
+            "A": (
+                [(2, 4), (3, 1), (7, 16), (17, 9), (31, 8), (311, 1), (571, 1), (1321, 1), (5119, 1),
+                 (6011, 1), (14207, 1), (28477, 1), (76667, 1)],
+                False,
+            ),
+            "B": (
+                [(11, 18), (19, 1), (23, 13), (47, 1), (79, 1), (83, 1), (89, 1), (151, 1), (3347, 1),
+                 (17449, 1), (33461, 1), (51193, 1)],
+                True,
+            ),
+        },
+    ),
+    "BSIDH-3": (
+        0x76042798BBFB78AEBD02490BD2635DEC131ABFFFFFFFFFFFFFFFFFFFFFFFFFFF,
+        0,
+        {
+            "A": (
+                [(2, 110), (5, 1), (7, 2), (67, 1), (223, 1), (4229, 1), (9787, 1), (13399, 1), (21521, 1),
+                 (32257, 1), (47353, 1)],
+                False,
+            ),
+            "B": (
+                [(3, 34), (11, 1), (17, 1), (19, 2), (29, 1), (37, 1), (53, 2), (97, 1), (107, 1), (109, 1),
+                 (131, 1), (137, 1), (197, 1), (199, 1), (227, 1), (251, 1), (5519, 1), (9091, 1), (33997, 1),
+                 (38201, 1)],
+                True,
+            ),
+        },
+    ),
+}
+# fmt: on
+
+# Parameter sets constructed by `get_parameters()`
+_parameter_sets = {}
+
+
+def list_parameters():
+    """
+    Return the names of the known parameter sets
+    """
+    return tuple(_PARAMETERS)
+
+
+def get_parameters(name):
+    """
+    Return the parameter set with the given name
+    """
+    if name not in _parameter_sets:
+        try:
+            p, A, torsion = _PARAMETERS[name]
+        except KeyError:
+            raise ValueError(f"unknown parameter set: {name}")
+        _parameter_sets[name] = KummerParameters(name, p, A, torsion)
+    return _parameter_sets[name]
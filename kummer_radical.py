@@ -0,0 +1,319 @@
+"""
+Radical isogeny chains for small odd ell, starting and ending on the
+Kummer Lines of Montgomery curves
+
+===========================================================================
+
+USAGE:
+
+L_new = radical_isogeny_chain(L, xK, ell, n)
+
+Computes a chain of n isogenies of degree ell, where xK is a point of order
+ell on L which generates the kernel of the first step. Each following step
+is the non-backtracking ell-isogeny chosen by the radical. Currently ell = 3,
+ell = 5 and ell = 7 are supported.
+
+phis = radical_kummer_isogeny(xQ, ell, e)
+
+Computes the Vélu steps of the isogeny with kernel <xQ> of order ell^e, when
+`use_radical_chain(xQ, ell, e)` is True, and is used for these chains by
+`factored_kummer_isogeny()`.
+
+===========================================================================
+
+INFO:
+
+Radical isogenies: https://ia.cr/2020/1108
+Wouter Castryck, Thomas Decru and Frederik Vercauteren
+
+A curve E with a marked point P of order ell is written in Tate normal form
+such that P = (0, 0). The codomain of E -> E / <P> together with a marked
+point P' which generates the next non-backtracking kernel can then be
+written in terms of an ell-th root of a coefficient of E. Each step costs
+a single ell-th root, rather than a scalar multiplication to find the next
+kernel and a Vélu step.
+
+- ell = 3: E : y^2 + a1*x*y + a3*y = x^3, and with rho^3 = -a3
+  a1' = a1 - 6*rho,  a3' = 3*a1*rho^2 - a1^2*rho + 9*a3
+- ell = 5: E : y^2 + (1 - b)*x*y - b*y = x^3 - b*x^2, and with rho^5 = b
+  b' = rho * (rho^4 + 3rho^3 + 4rho^2 + 2rho + 1)
+          / (rho^4 - 2rho^3 + 4rho^2 - 3rho + 1)
+- ell = 7: E : y^2 + (1 - c)*x*y - b*y = x^3 - b*x^2, with b = d^3 - d^2
+  and c = d^2 - d, and with rho^7 = d^4 (d - 1)
+  d' = (2rho^5 + 7rho^4 + (3 - 13d)rho^3 + (6d^2 + 20d)rho^2 - 11d^2 rho
+        - 2d^3 + 12d^2)
+     / (15rho^4 - (8d + 6)rho^3 + (2d^2 + 15d)rho^2 + (3d - 24d^2)rho
+        + 5d^3 + 5d^2)
+
+In each case rho^ell = f(-P) for the function f with divisor
+ell(P) - ell(O), normalised by its leading term at O, and P' is the image
+of a point R with [ell]R = -P. The formula for ell = 7 was interpolated
+from such chains and checked against Vélu chains over other primes.
+
+The choice of ell-th root selects the next step of the chain. When ell
+does not divide q - 1 for the base field GF(q), the ell-th root is unique
+and computed with one exponentiation. This is the case for CSIDH, where
+the chain is the unique rational non-backtracking path and radical chains
+compute l^n for repeated exponents.
+
+In the same case, a kernel <Q> of order ell^e with Q on the curve is the
+unique rational path, so `factored_kummer_isogeny()` finds the kernel of
+each Vélu step with the radical rather than with scalar multiplications
+and images of Q. The kernel on the Montgomery codomain of the Vélu step is
+the image of P' = (0, 0) under the isomorphism x = u^2 x' + r from the
+Tate normal form, where u^2 = c6 c4' / (c4 c6') and 12r = u^2 b2' - b2 are
+read off the invariants, without any root. For j = 0 or 1728 this fails,
+and the remaining steps use the sparse strategy.
+
+Over GF(p^2) with ell | p + 1, there are ell choices of root, and these
+chains cannot follow a prescribed kernel of order ell^e, so they are
+not used for these kernels.
+
+The conversions between Montgomery and Tate normal form for a chain are
+only done at the start and end: to Tate normal form by lifting the kernel
+to a point on the curve (one square root) and back to the Montgomery form
+by moving a point of order two to (0, 0) and scaling by a square root.
+"""
+
+# Python imports
+import math
+
+# Local imports
+from kummer_line import KummerLine, KummerPoint, pari
+from kummer_isogeny import KummerLineIsogeny_Velu
+
+RADICAL_DEGREES = (3, 5, 7)
+
+
+def _nth_root(F, x, ell):
+    """
+    Compute an ell-th root of x in the field F, using a single
+    exponentiation when the root is unique
+    """
+    q = F.order()
+    if math.gcd(ell, q - 1) == 1:
+        return x ** pow(int(ell), -1, int(q - 1))
+    return pari(F(x).nth_root(ell))
+
+
+def _tate_normal_form(xK, ell):
+    """
+    Given xK of order ell on a KummerLine, lift to a point K = (xK, yK)
+    and compute the coefficients (a1, a2, a3) of a model
+
+        y^2 + a1*x*y + a3*y = x^3 + a2*x^2
+
+    with K = (0, 0), by translating K to the origin and then
+    changing y to make the tangent line at K horizontal.
+    """
+    L = xK.parent()
+    a = L.a()
+    K = xK.curve_point()
+    x, y = pari(K[0]), pari(K[1])
+
+    # Slope of the tangent line at K
+    lam = (x * (3 * x + 2 * a) + 1) / (y + y)
+
+    a1 = lam + lam
+    a2 = 3 * x + a - lam * lam
+    a3 = y + y
+    return a1, a2, a3
+
+
+def _radical_parameters(ell, a1, a2, a3):
+    """
+    Compute the parameters of the Tate normal form of degree ell from
+    the coefficients (a1, a2, a3) of `_tate_normal_form()`
+    """
+    if ell == 3:
+        return a1, a3
+
+    # Scale (x, y) -> (u^2 x, u^3 y) with u = a3/a2 such that
+    # a2 = a3 = -b, then for a point of order 5 we have b = c
+    b = -(a2**3) / (a3 * a3)
+    if ell == 5:
+        return (b,)
+    c = 1 - a1 * a2 / a3
+    return (b / c,)
+
+
+def _radical_coefficients(ell, parameters):
+    """
+    Compute the coefficients (a1, a2, a3) of the Tate normal form of
+    degree ell with the given parameters
+    """
+    if ell == 3:
+        a1, a3 = parameters
+        return a1, 0, a3
+    if ell == 5:
+        (b,) = parameters
+        return 1 - b, -b, -b
+    (d,) = parameters
+    c = d * d - d
+    b = d * c
+    return 1 - c, -b, -b
+
+
+def _radical_step(F, ell, parameters):
+    """
+    Compute the parameters of the Tate normal form of the next step
+    of a radical chain of degree ell
+    """
+    if ell == 3:
+        a1, a3 = parameters
+        rho = _nth_root(F, -a3, 3)
+        return a1 - 6 * rho, (3 * a1 * rho - a1 * a1) * rho + 9 * a3
+
+    if ell == 5:
+        (b,) = parameters
+        rho = _nth_root(F, b, 5)
+        num = (((rho + 3) * rho + 4) * rho + 2) * rho + 1
+        den = (((rho - 2) * rho + 4) * rho - 3) * rho + 1
+        return (rho * num / den,)
+
+    (d,) = parameters
+    d2 = d * d
+    rho = _nth_root(F, d2 * d2 * (d - 1), 7)
+    num = (((2 * rho + 7) * rho + 3 - 13 * d) * rho + d * (6 * d + 20)) * rho
+    num = (num - 11 * d2) * rho + d2 * (12 - 2 * d)
+    den = (((15 * rho - 8 * d - 6) * rho + d * (2 * d + 15)) * rho + d * (3 - 24 * d))
+    den = den * rho + 5 * d2 * (d + 1)
+    return (num / den,)
+
+
+def _invariants(a1, a2, a3):
+    """
+    Compute the invariants (b2, c4, c6) of the curve
+    y^2 + a1*x*y + a3*y = x^3 + a2*x^2
+    """
+    b2 = a1 * a1 + 4 * a2
+    b4 = a1 * a3
+    b6 = a3 * a3
+    c4 = b2 * b2 - 24 * b4
+    c6 = (36 * b4 - b2 * b2) * b2 - 216 * b6
+    return b2, c4, c6
+
+
+def _montgomery_coefficient(F, a1, a2, a3):
+    """
+    Compute the coefficient A of a Montgomery curve y^2 = x^3 + Ax^2 + x
+    isomorphic over F to y^2 + a1*x*y + a3*y = x^3 + a2*x^2
+
+    Completing the square gives y^2 = g(x) = x^3 + a*x^2 + b*x + c. For a
+    root x0 of g, moving (x0, 0) to (0, 0) gives y^2 = x^3 + a'x^2 + b'x,
+    and scaling x by a square root s of b' which is itself a square gives
+    A = a'/s.
+    """
+    a = (a1 * a1 + 4 * a2) / 4
+    b = a1 * a3 / 2
+    c = a3 * a3 / 4
+
+    # x-coordinates of the points of order two
+    for x0 in pari.Pol([1, a, b, c]).polrootsmod():
+        a_shift = 3 * x0 + a
+        b_shift = (a_shift + a) * x0 + b
+        if not b_shift.issquare():
+            continue
+        s = b_shift.sqrt()
+        if not s.issquare():
+            s = -s
+        if s.issquare():
+            return a_shift / s
+
+    raise ValueError("The codomain has no Montgomery model over the base field")
+
+
+def _kernel_on_line(L, a1, a2, a3):
+    """
+    Compute the image of the point (0, 0) of the Tate normal form
+    y^2 + a1*x*y + a3*y = x^3 + a2*x^2 on an isomorphic Kummer Line L,
+    or None when the isomorphism is not determined by c4 and c6, that is
+    when j = 0 or j = 1728
+    """
+    b2, c4, c6 = _invariants(a1, a2, a3)
+    if not (c4 and c6):
+        return None
+
+    # For L, b2' = 4A, c4' = 16(A^2 - 3) and c6' = 32A(9 - 2A^2). Then
+    # x = u^2 x' + r with u^2 = c6 c4' / (c4 c6') and 12r = u^2 b2' - b2,
+    # so x' = -r / u^2 = (b2 c4 c6' - b2' c6 c4') / (12 c6 c4') for the
+    # point (0, 0), and we remove the common factor 32
+    A = L.a()
+    t = A * A - 3
+    X = A * (b2 * c4 * (3 - 2 * t) - 2 * c6 * t)
+    Z = 6 * c6 * t
+    return L((X, Z))
+
+
+def use_radical_chain(xQ, ell, e):
+    """
+    Return True if the isogeny with kernel <xQ> of order ell^e is computed
+    with `radical_kummer_isogeny()`: the ell-th roots are unique, so the
+    radical chain is the unique rational path, and Q is on the curve,
+    so the kernel is this path
+    """
+    if ell not in RADICAL_DEGREES or e < 2:
+        return False
+    L = xQ.parent()
+    q = L.base_ring().order()
+    if math.gcd(ell, q - 1) != 1:
+        return False
+    return L.is_on_curve(xQ)
+
+
+def radical_kummer_isogeny(xQ, ell, e, interrupt=None):
+    """
+    Compute the Vélu steps of the isogeny with kernel <xQ> of order
+    ell^e, where `use_radical_chain(xQ, ell, e)` is True. The kernel of
+    each step after the first is found with a radical step rather than
+    scalar multiplications. When this fails, for j = 0 or 1728, fewer
+    than e steps are returned.
+
+    When supplied, `interrupt()` is called before each step, and can
+    raise an exception to abandon the chain
+    """
+    xK = ell ** (e - 1) * xQ
+    F = xK.parent().base_ring()
+    parameters = _radical_parameters(ell, *_tate_normal_form(xK, ell))
+
+    phis = []
+    for i in range(e):
+        if interrupt is not None:
+            interrupt()
+        phi = KummerLineIsogeny_Velu(xK.parent(), xK, ell, check=False)
+        phis.append(phi)
+        if i == e - 1:
+            break
+
+        parameters = _radical_step(F, ell, parameters)
+        a1, a2, a3 = _radical_coefficients(ell, parameters)
+        xK = _kernel_on_line(phi.codomain(), a1, a2, a3)
+        if xK is None:
+            break
+
+    return phis
+
+
+def radical_isogeny_chain(L, xK, ell, n):
+    """
+    Compute the codomain of a chain of n non-backtracking isogenies of
+    degree ell, where the first step has kernel <xK>
+    """
+    if not isinstance(L, KummerLine):
+        raise ValueError(f"not a kummer line: {L}")
+    if not isinstance(xK, KummerPoint) or xK.parent() != L:
+        raise ValueError(f"Kernel {xK} is not a point on {L}")
+    if ell not in RADICAL_DEGREES:
+        raise NotImplementedError(f"Radical isogenies of degree {ell} are not implemented")
+    if not xK.has_order(ell):
+        raise ValueError("Input point does not have correct order")
+
+    F = L.base_ring()
+    parameters = _radical_parameters(ell, *_tate_normal_form(xK, ell))
+    for _ in range(n):
+        parameters = _radical_step(F, ell, parameters)
+
+    # Convert back to a Montgomery curve
+    a1, a2, a3 = _radical_coefficients(ell, parameters)
+    A = _montgomery_coefficient(F, a1, a2, a3)
+    return KummerLine(F, [A, 1])
@@ -0,0 +1,282 @@
+"""
+Non-backtracking walks in the supersingular ell-isogeny graph using
+x-only arithmetic on Kummer Lines
+
+===========================================================================
+
+USAGE:
+
+W = KummerLineWalk(L, ell, e)
+L_new = W.walk(digits)
+
+Where L is the KummerLine of a supersingular Montgomery curve over GF(p^2)
+and ell^e divides p + 1. Every digit in `digits` is an integer 0 <= d < ell
+and selects one of the ell non-backtracking ell-isogenies from the current
+curve.
+
+The walk can be used as a CGL-style hash function by
+
+j = W.hash(message)
+
+and to generate random supersingular curves with
+
+L_rand = W.random_walk(steps)
+
+When twist=True, the torsion is taken from the quadratic twist, and we
+require ell^e to divide p - 1 instead.
+
+===========================================================================
+
+INFO:
+
+The walk is computed in blocks of e steps. On each curve we have a basis
+(xP, xQ, xPQ) of E[ell^e] and a block of e digits defines the scalar
+
+s = d_0 + d_1 * ell + ... + d_(e-1) * ell^(e-1)
+
+such that the kernel of the block is <P + [s]Q>. The first step of the
+block has kernel <[ell^(e-1)](P + [s]Q)> which only depends on d_0, and
+so on for the following steps.
+
+The point Q is chosen such that [ell^(e-1)]Q generates the kernel of the
+dual of the previous step, so no kernel P + [s]Q ever backtracks. We track
+this by pushing Q through each block: the image phi(Q) generates the kernel
+of the dual isogeny. On the codomain, we only need to find one new point
+P' of order ell^e which is independent of phi(Q), together with x(P' - Q')
+which costs one square root.
+
+For ell = 2, the x-only Renes formula cannot be used with the kernel (0,0).
+As the image of (0,0) under these isogenies is (0,0), it is always the
+kernel of the dual, so we only need to ensure the initial basis has (0,0)
+below Q.
+
+Optionally, the codomains of computed blocks are stored in a bounded LRU
+cache keyed by the incoming point xQ and the digits of the block, so
+repeated walks from the same curves (such as hashing messages with a
+common prefix) reuse previously computed isogenies. The point xQ fixes
+both the Montgomery model of the curve and the direction we arrived from,
+and the basis completing it is deterministic, so it determines how the
+digits label the kernels. A cache hit also skips computing this basis.
+"""
+
+# Python imports
+from collections import OrderedDict, namedtuple
+import random
+
+# Local imports
+from kummer_line import KummerLine, Integer
+from kummer_isogeny import KummerLineIsogeny
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class KummerLineWalk:
+    """
+    Non-backtracking walks in the ell-isogeny graph of supersingular
+    Montgomery curves, computed with KummerLineIsogeny
+    """
+
+    def __init__(self, domain, ell, e, basis=None, twist=False, cache_size=None):
+        if not isinstance(domain, KummerLine):
+            raise ValueError(f"not a kummer line: {domain}")
+
+        F = domain.base_ring()
+        if F.degree() != 2:
+            raise ValueError("Walks are only supported over GF(p^2)")
+
+        p = F.characteristic()
+        ell = Integer(ell)
+        if not ell.is_prime():
+            raise ValueError(f"{ell = } must be prime")
+
+        # The order of the curve (or its twist) is (p +/- 1)^2 and
+        # is isomorphic to Z/(p +/- 1) x Z/(p +/- 1)
+        N = p - 1 if twist else p + 1
+        if N % ell**e:
+            raise ValueError(f"{ell}^{e} does not divide the order {N}")
+
+        self._domain = domain
+        self._ell = ell
+        self._e = e
+        self._twist = twist
+        self._cofactor = N // ell**e
+
+        # Basis of E[ell^e] for the first block
+        if basis is None:
+            basis = self._initial_basis(domain)
+        else:
+            basis = tuple(basis)
+            if any(X.parent() != domain for X in basis):
+                raise ValueError("The basis must consist of points on the domain")
+        self._basis = basis
+
+        # LRU cache of computed blocks
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        return f"Non-backtracking {self._ell}-isogeny walk from {self._domain}"
+
+    def domain(self):
+        """
+        Return the starting point of the walk
+        """
+        return self._domain
+
+    def cache_info(self):
+        """
+        Return the hit and miss statistics of the block cache
+        """
+        return CacheInfo(self._hits, self._misses, self._cache_size, len(self._cache))
+
+    def cache_clear(self):
+        """
+        Remove all entries from the block cache
+        """
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    # =================================== #
+    #    Torsion sampling and bases       #
+    # =================================== #
+
+    def _torsion_points(self, L):
+        """
+        Deterministically generate points of order ell^e on L
+        by clearing the cofactor of the points from
+        `L.sample_points()` on the curve (or the twist)
+        """
+        ell_e1 = self._ell ** (self._e - 1)
+        for T in L.sample_points(twist=self._twist):
+            # Clear the cofactor and ensure the point has full order
+            T = self._cofactor * T
+            B = ell_e1 * T
+            if B.is_zero():
+                continue
+            yield T, B
+
+    def _complete_basis(self, L, xQ):
+        """
+        Given xQ of order ell^e on L, find a point xP of order ell^e
+        independent of xQ and compute xPQ = x(P - Q)
+        """
+        B_Q = self._ell ** (self._e - 1) * xQ
+        B_Q_multiples = list(B_Q.multiples())
+
+        for xP, B_P in self._torsion_points(L):
+            if all(B_P != T for T in B_Q_multiples):
+                break
+
+        xPQ = xP.difference(xQ)
+        return xP, xQ, xPQ
+
+    def _initial_basis(self, L):
+        """
+        Compute a basis (xP, xQ, xPQ) of E[ell^e] on L, such that
+        for ell = 2, we have [2^(e-1)]Q = (0,0)
+        """
+        xQ, _ = next(self._torsion_points(L))
+        xP, xQ, xPQ = self._complete_basis(L, xQ)
+
+        if self._ell == 2:
+            ell_e1 = self._ell ** (self._e - 1)
+            if not (ell_e1 * xP).XZ()[0]:
+                xP, xQ = xQ, xP
+            elif (ell_e1 * xQ).XZ()[0]:
+                # x(P - (P + Q)) = x(Q)
+                xP, xQ, xPQ = xP, xP.add(xQ, xPQ), xQ
+
+        return xP, xQ, xPQ
+
+    # =================================== #
+    #         Walking the graph           #
+    # =================================== #
+
+    def _block(self, xQ, digits):
+        """
+        Compute the isogeny of degree ell^k for k = len(digits) with
+        kernel <P + [s]Q> and return the codomain and the image of Q,
+        where (P, Q) is the initial basis when xQ is None and the basis
+        completing xQ otherwise
+        """
+        key = (xQ, digits)
+        if self._cache_size is not None and key in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self._misses += 1
+
+        if xQ is None:
+            xP, xQ, xPQ = self._basis
+        else:
+            xP, xQ, xPQ = self._complete_basis(xQ.parent(), xQ)
+        k = len(digits)
+        s = sum(d * self._ell**i for i, d in enumerate(digits))
+
+        # Kernel of order ell^k
+        xK = xQ.ladder_3_pt(xP, xPQ, s)
+        if k < self._e:
+            xK = self._ell ** (self._e - k) * xK
+
+        phi = KummerLineIsogeny(
+            xK.parent(), xK, self._ell**k, check=False, points=[xQ]
+        )
+        (imxQ,) = phi.images()
+        result = (phi.codomain(), imxQ)
+
+        if self._cache_size is not None:
+            self._cache[key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def walk(self, digits):
+        """
+        Walk len(digits) steps in the ell-isogeny graph, where each
+        digit 0 <= d < ell selects one of the ell non-backtracking
+        isogenies from the current curve
+
+        Returns the KummerLine at the end of the walk
+        """
+        digits = tuple(digits)
+        if any(not 0 <= d < self._ell for d in digits):
+            raise ValueError(f"Digits must be in the range [0, {self._ell})")
+
+        L = self._domain
+        xQ = None
+        for i in range(0, len(digits), self._e):
+            L, xQ = self._block(xQ, digits[i : i + self._e])
+
+        return L
+
+    def hash(self, message):
+        """
+        CGL-style hash of the bytes `message`, the message is
+        written in base ell and used as the digits of a walk
+
+        Returns the j-invariant of the final curve
+        """
+        n = int.from_bytes(message, "big")
+        bound = 1 << (8 * len(message))
+
+        digits = []
+        t = 1
+        while t < bound:
+            n, d = divmod(n, self._ell)
+            digits.append(d)
+            t *= self._ell
+
+        return self.walk(digits).j_invariant()
+
+    def random_walk(self, steps):
+        """
+        Walk `steps` random non-backtracking steps in the ell-isogeny
+        graph, for steps >> log(p) this gives a random supersingular
+        curve
+        """
+        digits = [random.randrange(self._ell) for _ in range(steps)]
+        return self.walk(digits)